@@ -0,0 +1,102 @@
+"""Compare link rewriting in the markdown pipeline against the old regex pass.
+
+Run from the ``backend`` directory::
+
+    python -m benchmarks.link_benchmark --links 20000
+"""
+import argparse
+import re
+import time
+from typing import Callable, List
+import markdown
+from src.services.links import CONTENT_ENDPOINT, RelativeLinkExtension
+
+EXTENSIONS: List = ['toc', 'tables', 'fenced_code', 'nl2br']
+
+
+def regex_rewrite(html_content: str) -> str:
+    """The post-render pass MarkdownService used before the tree processor."""
+    return re.sub(
+        r'<a href="([^"]*\.md)"[^>]*>([^<]*)</a>',
+        lambda m: f'<a href="/api/content?path={m.group(1).lstrip("./")}">{m.group(2)}</a>',
+        html_content
+    )
+
+
+def link_dense_document(links: int, anchors: bool = True) -> str:
+    """Build a document with ``links`` links spread over short paragraphs.
+
+    The regex pass skips links with a ``#fragment``; without ``anchors``
+    both sides rewrite the same links.
+    """
+    paragraphs = []
+    for i in range(0, links, 10):
+        paragraphs.append(" ".join(
+            f"See [page {j}](../section-{j % 13}/page-{j}.md"
+            f"{f'#part-{j % 5}' if anchors else ''}) for details."
+            if j % 4 else f"Or [the site](https://example.com/{j})."
+            for j in range(i, min(i + 10, links))
+        ))
+    return "# Link index\n\n" + "\n\n".join(paragraphs)
+
+
+def best_of(repeat: int, *fns: Callable[[], object]) -> List[float]:
+    """Return the fastest of ``repeat`` interleaved timings of each function."""
+    timings: List[List[float]] = [[] for _ in fns]
+    for _ in range(repeat):
+        for fn, fn_timings in zip(fns, timings):
+            started = time.perf_counter()
+            fn()
+            fn_timings.append(time.perf_counter() - started)
+    return [min(fn_timings) for fn_timings in timings]
+
+
+def main() -> None:
+    """Run the benchmark and print per-conversion timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--links", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    plain = markdown.Markdown(extensions=EXTENSIONS)
+    extension = RelativeLinkExtension()
+    in_pipeline = markdown.Markdown(extensions=EXTENSIONS + [extension])
+
+    for anchors in (True, False):
+        document = link_dense_document(args.links, anchors)
+
+        def convert_plain() -> str:
+            html = plain.convert(document)
+            plain.reset()
+            return html
+
+        def convert_with_regex() -> str:
+            return regex_rewrite(convert_plain())
+
+        def convert_in_pipeline() -> str:
+            extension.source_directory = "guides"
+            html = in_pipeline.convert(document)
+            in_pipeline.reset()
+            return html
+
+        html = convert_plain()
+        baseline, before, after = best_of(
+            args.repeat, convert_plain, convert_with_regex, convert_in_pipeline
+        )
+        (regex_pass,) = best_of(args.repeat, lambda: regex_rewrite(html))
+        regex_rewritten = regex_rewrite(html).count(CONTENT_ENDPOINT)
+        pipeline_rewritten = convert_in_pipeline().count(CONTENT_ENDPOINT)
+
+        print(f"document:               {len(document) / 1024:,.0f} KiB, {args.links} links, "
+              f"{'with' if anchors else 'without'} anchors")
+        print(f"convert only:           {baseline * 1000:,.1f} ms")
+        print(f"before (regex pass):    {before * 1000:,.1f} ms  "
+              f"(regex alone {regex_pass * 1000:,.1f} ms, {regex_rewritten} links rewritten)")
+        print(f"after (tree processor): {after * 1000:,.1f} ms  "
+              f"(link handling {(after - baseline) * 1000:,.1f} ms, "
+              f"{pipeline_rewritten} links rewritten)")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Measure the memory held per document by the catalog representations.
+
+Run from the ``backend`` directory::
+
+    python -m benchmarks.memory_benchmark --documents 5000
+"""
+import argparse
+import gc
+import tempfile
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+from src.models import FileInfo
+from src.services.catalog import DocumentCatalog
+from src.services.markdown_service import MarkdownService
+
+
+@dataclass
+class LegacyFileInfo:
+    """FileInfo as it was before slots and interning."""
+    name: str
+    path: str
+    is_directory: bool
+    size: int
+    modified_time: Optional[float] = None
+
+
+@dataclass
+class LegacyMarkdownContent:
+    """MarkdownContent as it was before slots."""
+    raw_content: str
+    html_content: str
+    frontmatter: Dict[str, Any]
+    file_path: str
+    title: Optional[str] = None
+
+
+def write_corpus(directory: Path, documents: int) -> None:
+    """Write a synthetic knowledge base of ``documents`` files."""
+    for i in range(documents):
+        subdir = directory / f"section-{i % 20}" / f"topic-{i % 7}"
+        subdir.mkdir(parents=True, exist_ok=True)
+        paragraphs = "\n\n".join(
+            f"Paragraph {p} of document {i} with a [link](./doc-{p}.md) and some **bold** text."
+            for p in range(20)
+        )
+        (subdir / f"doc-{i}.md").write_text(
+            f'---\ntitle: "Document {i}"\ntags: ["a", "b"]\n---\n\n# Document {i}\n\n{paragraphs}\n'
+        )
+
+
+def measure(build: Callable[[], Any]) -> int:
+    """Return the bytes still allocated by the object ``build`` returns."""
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del result
+    return retained
+
+
+def main() -> None:
+    """Run the benchmark and print bytes per document."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        base = Path(temp_dir)
+        write_corpus(base, args.documents)
+        service = MarkdownService(base)
+        files = sorted(base.rglob("*.md"))
+
+        # Import markdown/Pygments and build the processor outside the measurement
+        service.parse_markdown(files[0].relative_to(base))
+
+        def build_before():
+            catalog = []
+            for file_path in files:
+                content = service.parse_markdown(file_path.relative_to(base))
+                info = FileInfo.from_path(file_path, base)
+                catalog.append((
+                    LegacyFileInfo(info.name, info.path, info.is_directory,
+                                   info.size, info.modified_time),
+                    LegacyMarkdownContent(content.raw_content, content.html_content,
+                                          dict(content.frontmatter), content.file_path,
+                                          content.title),
+                ))
+            return catalog
+
+        def build_after():
+            catalog = DocumentCatalog(base)
+            catalog.refresh()
+            return catalog
+
+        before = measure(build_before)
+        after = measure(build_after)
+
+    print(f"documents:          {args.documents}")
+    print(f"before (bytes/doc): {before / args.documents:,.0f}")
+    print(f"after  (bytes/doc): {after / args.documents:,.0f}")
+    print(f"reduction:          {before / max(after, 1):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+"""serve-md backend package."""
+# Imported first so startup timing covers every module loaded after it
+from . import startup  # noqa: F401
@@ -1,19 +1,63 @@
 """Main FastAPI application for serve-md."""
 import argparse
+import json
+import time
+from contextlib import asynccontextmanager
+from dataclasses import asdict
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Dict, Iterator, List, Mapping, Optional, Union
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from .services.markdown_service import MarkdownService
+from .services.roots import RootRegistry
+from .startup import IMPORT_STARTED
 
 
-def create_app(base_directory: Path) -> FastAPI:
-    """Create and configure the FastAPI application."""
+def parse_roots(values: List[str]) -> Dict[str, Path]:
+    """Parse ``--directory`` values of the form ``name=path`` or ``path``.
+    
+    Unnamed roots are named after their directory.
+    """
+    roots: Dict[str, Path] = {}
+    for value in values:
+        name, separator, directory = value.partition("=")
+        if not separator:
+            directory = value
+            name = Path(value).resolve().name or "root"
+        if not name:
+            raise ValueError(f"Root name cannot be empty: '{value}'")
+        if name in roots:
+            raise ValueError(f"Duplicate root name: '{name}'")
+        roots[name] = Path(directory).resolve()
+    return roots
+
+
+def create_app(base_directory: Union[Path, Mapping[str, Path]]) -> FastAPI:
+    """Create and configure the FastAPI application.
+    
+    ``base_directory`` is either a single directory or a mapping of root
+    names to directories; the first root is used when a request names none.
+    """
+    # Initialize one markdown service per root
+    if isinstance(base_directory, Mapping):
+        roots = RootRegistry(base_directory)
+    else:
+        roots = RootRegistry(parse_roots([str(base_directory)]))
+    
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        """Warm up the roots in the background and release the pool on shutdown."""
+        roots.start_warmup()
+        yield
+        roots.close()
+    
     app = FastAPI(
         title="serve-md",
         description="A web application to serve and render Markdown files",
-        version="0.1.0"
+        version="0.1.0",
+        lifespan=lifespan
     )
     
     # Add CORS middleware
@@ -25,19 +69,69 @@ def create_app(base_directory: Path) -> FastAPI:
         allow_headers=["*"],
     )
     
-    # Initialize the markdown service
-    markdown_service = MarkdownService(base_directory)
+    app.state.roots = roots
+    
+    def get_service(root: Optional[str]) -> MarkdownService:
+        """Resolve the service for a root name."""
+        try:
+            return roots.get(root)
+        except KeyError:
+            raise HTTPException(status_code=404, detail="Root not found")
     
     @app.get("/health")
     async def health_check():
         """Health check endpoint."""
         return {"status": "healthy", "service": "serve-md"}
     
+    @app.get("/ready")
+    async def readiness_check():
+        """Readiness endpoint; returns 503 until every root's catalog is built or has failed."""
+        readiness = roots.readiness()
+        if readiness["ready"]:
+            readiness["status"] = "ready"
+        else:
+            readiness["status"] = "failed" if readiness["failed"] else "warming"
+        return JSONResponse(status_code=200 if readiness["ready"] else 503, content=readiness)
+    
+    @app.get("/api/roots")
+    async def list_roots():
+        """List the configured knowledge-base roots."""
+        return [{"name": name, "default": name == roots.default_name} for name in roots.names]
+    
     @app.get("/api/directory")
-    async def get_directory(path: str = Query(".", description="Directory path")):
-        """Get directory listing."""
+    async def get_directory(
+        path: str = Query(".", description="Directory path"),
+        root: Optional[str] = Query(None, description="Knowledge-base root"),
+        sort: str = Query("name", pattern="^(name|mtime|size)$", description="Sort key"),
+        order: str = Query("asc", pattern="^(asc|desc)$", description="Sort order"),
+        q: Optional[str] = Query(None, description="Only include names containing this text"),
+        cursor: Optional[str] = Query(None, description="Cursor from a previous page"),
+        limit: Optional[int] = Query(None, ge=1, le=10000, description="Page size"),
+        stream: bool = Query(False, description="Stream every entry as NDJSON")
+    ):
+        """Get directory listing.
+        
+        Directories are always listed before files. With ``limit`` a single
+        page is returned together with ``next_cursor``; with ``stream`` the
+        entries are sent one JSON object per line.
+        """
+        markdown_service = get_service(root)
+        descending = order == "desc"
         try:
-            directory_info = markdown_service.get_directory_info(path)
+            if stream:
+                entries = await run_in_threadpool(
+                    markdown_service.iter_directory, path, sort, descending, q, cursor
+                )
+                
+                def ndjson() -> Iterator[str]:
+                    for _, entry in entries:
+                        yield json.dumps(asdict(entry)) + "\n"
+                
+                return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+            
+            directory_info = await run_in_threadpool(
+                markdown_service.get_directory_info, path, sort, descending, q, cursor, limit
+            )
             return directory_info
         except FileNotFoundError:
             raise HTTPException(status_code=404, detail="Directory not found")
@@ -45,10 +139,14 @@ def create_app(base_directory: Path) -> FastAPI:
             raise HTTPException(status_code=400, detail=str(e))
     
     @app.get("/api/content")
-    async def get_content(path: str = Query(..., description="File path")):
+    async def get_content(
+        path: str = Query(..., description="File path"),
+        root: Optional[str] = Query(None, description="Knowledge-base root")
+    ):
         """Get markdown file content."""
+        markdown_service = get_service(root)
         try:
-            content = markdown_service.parse_markdown(Path(path))
+            content = await run_in_threadpool(markdown_service.parse_markdown, Path(path))
             return content
         except FileNotFoundError:
             raise HTTPException(status_code=404, detail="File not found")
@@ -56,17 +154,25 @@ def create_app(base_directory: Path) -> FastAPI:
             raise HTTPException(status_code=400, detail=str(e))
     
     @app.get("/api/search")
-    async def search_content(q: str = Query(..., description="Search query")):
-        """Search content across all markdown files."""
+    async def search_content(
+        q: str = Query(..., description="Search query"),
+        limit: int = Query(50, ge=1, le=1000, description="Maximum number of results")
+    ):
+        """Search content across all markdown files in every root."""
         if not q.strip():
             raise HTTPException(status_code=400, detail="Search query cannot be empty")
         
         try:
-            results = markdown_service.search_content(q)
+            results = await run_in_threadpool(roots.search, q, limit)
             return results
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
     
+    @app.get("/api/metrics")
+    async def get_metrics():
+        """Report how often concurrent requests were coalesced."""
+        return roots.metrics()
+    
     @app.exception_handler(Exception)
     async def global_exception_handler(request, exc):
         """Global exception handler."""
@@ -85,8 +191,9 @@ def main():
         "--directory",
         "-d",
         type=str,
-        default=".",
-        help="Directory containing markdown files (default: current directory)"
+        action="append",
+        help="Directory containing markdown files, optionally named as name=path; "
+             "repeat to serve several roots (default: current directory)"
     )
     parser.add_argument(
         "--host",
@@ -109,23 +216,34 @@ def main():
     
     args = parser.parse_args()
     
-    # Validate directory
-    base_directory = Path(args.directory).resolve()
-    if not base_directory.exists():
-        print(f"Error: Directory '{base_directory}' does not exist")
+    # Validate directories
+    try:
+        roots = parse_roots(args.directory or ["."])
+    except ValueError as e:
+        print(f"Error: {e}")
         return 1
     
-    if not base_directory.is_dir():
-        print(f"Error: '{base_directory}' is not a directory")
-        return 1
+    for base_directory in roots.values():
+        if not base_directory.exists():
+            print(f"Error: Directory '{base_directory}' does not exist")
+            return 1
+        
+        if not base_directory.is_dir():
+            print(f"Error: '{base_directory}' is not a directory")
+            return 1
     
     print(f"Starting serve-md server...")
-    print(f"Base directory: {base_directory}")
+    for name, base_directory in roots.items():
+        print(f"Root '{name}': {base_directory}")
     print(f"Server: http://{args.host}:{args.port}")
     print(f"API docs: http://{args.host}:{args.port}/docs")
     
     # Create the app
-    app = create_app(base_directory)
+    started = time.perf_counter()
+    app = create_app(roots)
+    print(f"Startup: imports {(started - IMPORT_STARTED) * 1000:.0f} ms, "
+          f"app {(time.perf_counter() - started) * 1000:.0f} ms "
+          f"(index warm-up continues in the background, see /ready)")
     
     # Run the server
     import uvicorn
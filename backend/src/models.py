@@ -1,9 +1,50 @@
 """Data models for the serve-md application."""
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+import sys
+from typing import List, Dict, Any, Optional, Type, TypeVar
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 
+T = TypeVar("T")
 
+
+def slotted(cls: Type[T]) -> Type[T]:
+    """Rebuild a dataclass with ``__slots__`` so instances carry no ``__dict__``.
+
+    Equivalent to ``@dataclass(slots=True)``, which is only available from
+    Python 3.10 onwards.
+    """
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict = dict(cls.__dict__)
+    for name in field_names:
+        # Defaults are already baked into the generated __init__
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    cls_dict["__slots__"] = field_names
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
+def derive_title(frontmatter: Dict[str, Any], raw_content: str, file_path: str) -> str:
+    """Derive a document title from frontmatter, the first heading or the filename."""
+    # Try to get title from frontmatter
+    title = frontmatter.get('title')
+    
+    # If no title in frontmatter, try to extract from first heading
+    if not title and raw_content:
+        for line in raw_content.split('\n'):
+            line = line.strip()
+            if line.startswith('# '):
+                title = line[2:].strip()
+                break
+    
+    # Fallback to filename
+    if not title:
+        title = Path(file_path).stem.replace('-', ' ').replace('_', ' ').title()
+    
+    return title
+
+
+@slotted
 @dataclass
 class FileInfo:
     """Information about a file or directory."""
@@ -18,22 +59,28 @@ class FileInfo:
         """Create FileInfo from a file path."""
         relative_path = file_path.relative_to(base_path)
         stat = file_path.stat()
+        is_directory = file_path.is_dir()
         
+        # Intern names and paths so repeated listings share one string each
         return cls(
-            name=file_path.name,
-            path=str(relative_path).replace("\\", "/"),  # Normalize path separators
-            is_directory=file_path.is_dir(),
-            size=stat.st_size if not file_path.is_dir() else 0,
+            name=sys.intern(file_path.name),
+            path=sys.intern("/".join(relative_path.parts)),  # Normalize path separators
+            is_directory=is_directory,
+            size=stat.st_size if not is_directory else 0,
             modified_time=stat.st_mtime
         )
 
 
+@slotted
 @dataclass
 class DirectoryInfo:
     """Information about a directory and its contents."""
     name: str
     path: str
     files: List[FileInfo]
+    # Number of entries matching the listing's name filter, across all pages
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
     
     def get_markdown_files(self) -> List[FileInfo]:
         """Get only markdown files from the directory."""
@@ -44,6 +91,7 @@ class DirectoryInfo:
         return [f for f in self.files if f.is_directory]
 
 
+@slotted
 @dataclass
 class MarkdownContent:
     """Parsed markdown content with metadata."""
@@ -52,22 +100,9 @@ class MarkdownContent:
     frontmatter: Dict[str, Any]
     file_path: str
     title: Optional[str] = None
+    links: List[str] = field(default_factory=list)
     
     def __post_init__(self) -> None:
         """Extract title from frontmatter or content."""
         if not self.title:
-            # Try to get title from frontmatter
-            self.title = self.frontmatter.get('title')
-            
-            # If no title in frontmatter, try to extract from first heading
-            if not self.title and self.raw_content:
-                lines = self.raw_content.split('\n')
-                for line in lines:
-                    line = line.strip()
-                    if line.startswith('# '):
-                        self.title = line[2:].strip()
-                        break
-            
-            # Fallback to filename
-            if not self.title:
-                self.title = Path(self.file_path).stem.replace('-', ' ').replace('_', ' ').title()
\ No newline at end of file
+            self.title = derive_title(self.frontmatter, self.raw_content, self.file_path)
@@ -0,0 +1,396 @@
+"""Compact, column-oriented catalog of the markdown documents under a directory."""
+import mmap
+import os
+import re
+import sys
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from ..models import FileInfo, derive_title
+
+# Same boundary the python-frontmatter YAML handler splits on
+_FM_BOUNDARY = re.compile(rb"^-{3,}\s*$", re.MULTILINE)
+
+FLAG_HAS_FRONTMATTER = 0x01
+
+SORT_KEYS = ("name", "mtime", "size")
+
+# Seconds a directory's size and modification-time orders are trusted before
+# every entry is re-stat'd again
+STATS_TTL = 2.0
+
+# Filtered entry counts kept per directory index
+MAX_MATCH_COUNTS = 64
+
+
+def _body_offset(data: bytes) -> int:
+    """Return the byte offset at which the markdown body starts.
+
+    Mirrors ``frontmatter.parse``: leading whitespace is ignored and the
+    frontmatter block is only recognised when it is opened and closed by a
+    ``---`` line.
+    """
+    start = len(data) - len(data.lstrip())
+    if not data.startswith(b"---", start):
+        return 0
+    opening = _FM_BOUNDARY.match(data, start)
+    if opening is None:
+        return 0
+    closing = _FM_BOUNDARY.search(data, opening.end())
+    if closing is None:
+        return 0
+    return closing.end()
+
+
+class DocumentCatalog:
+    """Index of markdown documents stored as parallel columns.
+
+    Sizes, modification times, body offsets and flags live in ``array``
+    columns, directory components are interned and shared between siblings,
+    and document bodies stay on disk until :meth:`read_body` maps them in.
+    """
+
+    __slots__ = (
+        "base_directory",
+        "_directories",
+        "_names",
+        "_titles",
+        "_sizes",
+        "_mtimes",
+        "_body_offsets",
+        "_flags",
+    )
+
+    def __init__(self, base_directory: Path):
+        """Create an empty catalog for ``base_directory``."""
+        self.base_directory = Path(base_directory).resolve()
+        self._directories: List[str] = []
+        self._names: List[str] = []
+        self._titles: List[str] = []
+        self._sizes = array("q")
+        self._mtimes = array("d")
+        self._body_offsets = array("q")
+        self._flags = array("B")
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(len(self._names)))
+
+    def _scan(self) -> List[Tuple[Path, str, str, int, float]]:
+        """Walk the base directory and stat every visible markdown file."""
+        entries = []
+
+        def scan_directory(directory: Path, relative_dir: str):
+            try:
+                items = list(directory.iterdir())
+            except OSError:
+                # Skip directories removed or unreadable mid-walk
+                return
+
+            for item in items:
+                if item.name.startswith('.'):
+                    continue
+
+                if item.is_dir():
+                    child = f"{relative_dir}/{item.name}" if relative_dir else item.name
+                    scan_directory(item, sys.intern(child))
+                elif item.suffix == '.md':
+                    try:
+                        stat = item.stat()
+                    except OSError:
+                        # Skip dangling symlinks and files deleted mid-walk
+                        continue
+                    entries.append(
+                        (item, relative_dir, item.name, stat.st_size, stat.st_mtime)
+                    )
+
+        scan_directory(self.base_directory, "")
+        entries.sort(key=lambda e: (e[1], e[2]))
+        return entries
+
+    def refresh(self, progress: Optional[Callable[[int, int], None]] = None) -> None:
+        """Bring the catalog in line with the files on disk.
+
+        Only documents whose size or modification time changed are re-read;
+        everything else is carried over from the existing columns.
+        ``progress`` is called with ``(processed, total)`` as documents are
+        indexed.
+        """
+        previous = {
+            (self._directories[i], self._names[i]): i for i in range(len(self))
+        }
+        directories: List[str] = []
+        names: List[str] = []
+        titles: List[str] = []
+        sizes = array("q")
+        mtimes = array("d")
+        body_offsets = array("q")
+        flags = array("B")
+
+        entries = self._scan()
+        if progress is not None:
+            progress(0, len(entries))
+        for processed, (item, relative_dir, name, size, mtime) in enumerate(entries, 1):
+            if progress is not None:
+                progress(processed, len(entries))
+            i = previous.get((relative_dir, name))
+            if i is not None and self._sizes[i] == size and self._mtimes[i] == mtime:
+                title = self._titles[i]
+                offset = self._body_offsets[i]
+                flag = self._flags[i]
+            else:
+                try:
+                    title, offset, flag = self._read_header(item, relative_dir, name)
+                except Exception:
+                    # Skip files that can't be parsed
+                    continue
+
+            directories.append(relative_dir)
+            names.append(name)
+            titles.append(title)
+            sizes.append(size)
+            mtimes.append(mtime)
+            body_offsets.append(offset)
+            flags.append(flag)
+
+        self._directories = directories
+        self._names = names
+        self._titles = titles
+        self._sizes = sizes
+        self._mtimes = mtimes
+        self._body_offsets = body_offsets
+        self._flags = flags
+
+    def _read_header(self, item: Path, relative_dir: str, name: str) -> Tuple[str, int, int]:
+        """Read a document once to locate its body and derive its title."""
+        import frontmatter
+
+        data = item.read_bytes()
+        offset = _body_offset(data)
+        metadata = frontmatter.loads(data[:offset].decode("utf-8")).metadata if offset else {}
+        body = data[offset:].decode("utf-8").strip()
+        relative_path = f"{relative_dir}/{name}" if relative_dir else name
+        title = derive_title(metadata, body, relative_path)
+        return title, offset, FLAG_HAS_FRONTMATTER if offset else 0
+
+    def path(self, index: int) -> str:
+        """Return the document's path relative to the base directory."""
+        directory = self._directories[index]
+        name = self._names[index]
+        return f"{directory}/{name}" if directory else name
+
+    def title(self, index: int) -> str:
+        """Return the document's title."""
+        return self._titles[index]
+
+    def file_info(self, index: int) -> FileInfo:
+        """Materialize a :class:`FileInfo` for a single document."""
+        return FileInfo(
+            name=self._names[index],
+            path=sys.intern(self.path(index)),
+            is_directory=False,
+            size=self._sizes[index],
+            modified_time=self._mtimes[index]
+        )
+
+    def _map(self, index: int, start: int, end: int) -> bytes:
+        """Read ``[start, end)`` of a document through a read-only memory map."""
+        if end <= start:
+            return b""
+        with open(self.base_directory / self.path(index), 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return mapped[start:end]
+
+    def read_body(self, index: int) -> str:
+        """Read the markdown body (without frontmatter) of a document from disk."""
+        data = self._map(index, self._body_offsets[index], self._sizes[index])
+        return data.decode("utf-8").strip()
+
+    def read_frontmatter(self, index: int) -> Dict[str, Any]:
+        """Read and parse the frontmatter block of a document from disk."""
+        if not self._flags[index] & FLAG_HAS_FRONTMATTER:
+            return {}
+        import frontmatter
+
+        data = self._map(index, 0, self._body_offsets[index])
+        return frontmatter.loads(data.decode("utf-8")).metadata
+
+
+class DirectoryIndex:
+    """Pre-sorted, column-oriented listing of a single directory.
+
+    The index is tied to the directory's own modification time, so it is
+    rebuilt whenever entries are added, removed or renamed. Files edited in
+    place do not change that time, so entries are re-stat'd as they are
+    served, and the whole directory at most once every :data:`STATS_TTL`
+    seconds when listing by size or modification time; changed stats drop
+    those sort orders. The name order only depends on the entries and is
+    computed once. Listings run on worker threads, so the columns and caches
+    are only touched while holding the index's lock.
+    """
+
+    __slots__ = (
+        "version",
+        "_directory",
+        "_directory_path",
+        "_match_counts",
+        "_names",
+        "_sizes",
+        "_mtimes",
+        "_flags",
+        "_directory_count",
+        "_orders",
+        "_checked",
+        "_lock",
+    )
+
+    def __init__(self, directory: str, directory_path: Path, version: int):
+        """Create an empty index for ``directory`` (relative to the base directory)."""
+        self.version = version
+        self._directory = directory
+        self._directory_path = str(directory_path)
+        self._match_counts: "OrderedDict[str, int]" = OrderedDict()
+        self._names: List[str] = []
+        self._sizes = array("q")
+        self._mtimes = array("d")
+        self._flags = array("B")
+        self._directory_count = 0
+        self._orders: Dict[Tuple[str, bool], array] = {}
+        self._checked = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def build(cls, directory_path: Path, base_directory: Path, version: int) -> "DirectoryIndex":
+        """Stat the markdown files and subdirectories of ``directory_path``."""
+        relative_dir = "/".join(directory_path.relative_to(base_directory).parts)
+        index = cls(sys.intern(relative_dir), directory_path, version)
+        for item in directory_path.iterdir():
+            # Skip hidden files
+            if item.name.startswith('.'):
+                continue
+
+            # Include markdown files and directories
+            is_directory = item.is_dir()
+            if is_directory or item.suffix == '.md':
+                try:
+                    stat = item.stat()
+                except OSError:
+                    # Skip dangling symlinks and entries removed mid-listing
+                    continue
+                index._names.append(sys.intern(item.name))
+                index._sizes.append(stat.st_size if not is_directory else 0)
+                index._mtimes.append(stat.st_mtime)
+                index._flags.append(1 if is_directory else 0)
+                index._directory_count += is_directory
+        return index
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def count(self, name_filter: Optional[str] = None) -> int:
+        """Return the number of entries whose name contains ``name_filter``."""
+        if not name_filter:
+            return len(self._names)
+        needle = name_filter.lower()
+        with self._lock:
+            count = self._match_counts.get(needle)
+            if count is None:
+                count = sum(needle in name.lower() for name in self._names)
+                self._match_counts[needle] = count
+                if len(self._match_counts) > MAX_MATCH_COUNTS:
+                    self._match_counts.popitem(last=False)
+            else:
+                self._match_counts.move_to_end(needle)
+        return count
+
+    def _restat(self, position: int) -> None:
+        """Refresh the size and modification time of one entry from disk."""
+        try:
+            stat = os.stat(os.path.join(self._directory_path, self._names[position]))
+        except OSError:
+            return
+        size = stat.st_size if not self._flags[position] else 0
+        if self._sizes[position] != size or self._mtimes[position] != stat.st_mtime:
+            self._sizes[position] = size
+            self._mtimes[position] = stat.st_mtime
+            for key in [key for key in self._orders if key[0] != "name"]:
+                self._orders.pop(key, None)
+
+    def _restat_all(self) -> None:
+        """Re-stat every entry if the last full pass is older than the TTL."""
+        now = time.monotonic()
+        if now - self._checked < STATS_TTL:
+            return
+        self._checked = now
+        for position in range(len(self._names)):
+            self._restat(position)
+
+    def _order(self, sort: str, descending: bool) -> array:
+        """Return entry positions sorted by ``sort``, directories first."""
+        order = self._orders.get((sort, descending))
+        if order is not None:
+            return order
+
+        if descending:
+            ascending = self._order(sort, False)
+            split = self._directory_count
+            order = ascending[:split][::-1] + ascending[split:][::-1]
+        else:
+            names = self._names
+            if sort == "name":
+                def key(i: int) -> Any:
+                    return names[i].lower()
+            elif sort == "mtime":
+                key = self._mtimes.__getitem__
+            elif sort == "size":
+                key = self._sizes.__getitem__
+            else:
+                raise ValueError(f"Invalid sort key: {sort}")
+            flags = self._flags
+            order = array("l", sorted(range(len(names)), key=lambda i: (not flags[i], key(i))))
+        self._orders[(sort, descending)] = order
+        return order
+
+    def file_info(self, position: int) -> FileInfo:
+        """Materialize a :class:`FileInfo` for the entry at ``position``."""
+        name = self._names[position]
+        # Intern paths so repeated listings share one string per entry
+        return FileInfo(
+            name=name,
+            path=sys.intern(f"{self._directory}/{name}") if self._directory else name,
+            is_directory=bool(self._flags[position]),
+            size=self._sizes[position],
+            modified_time=self._mtimes[position]
+        )
+
+    def scan(
+        self,
+        sort: str = "name",
+        descending: bool = False,
+        name_filter: Optional[str] = None,
+        start: int = 0
+    ) -> Iterator[Tuple[int, FileInfo]]:
+        """Yield ``(next_start, entry)`` pairs in sorted order from ``start``.
+
+        ``next_start`` is the position to resume from after ``entry``.
+        """
+        with self._lock:
+            if sort != "name":
+                # The order itself depends on every entry's stats
+                self._restat_all()
+            order = self._order(sort, descending)
+        needle = name_filter.lower() if name_filter else None
+        for offset in range(start, len(order)):
+            position = order[offset]
+            if needle and needle not in self._names[position].lower():
+                continue
+            # Never hold the lock across a yield; streamed listings pause there
+            with self._lock:
+                self._restat(position)
+                entry = self.file_info(position)
+            yield offset + 1, entry
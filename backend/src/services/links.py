@@ -0,0 +1,96 @@
+"""Markdown extension that resolves relative document links while rendering."""
+import posixpath
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote, unquote, urlsplit
+from markdown import Markdown
+from markdown.extensions import Extension
+from markdown.treeprocessors import Treeprocessor
+
+CONTENT_ENDPOINT = "/api/content?path="
+
+
+def resolve_link(href: str, source_directory: str) -> Optional[str]:
+    """Resolve a relative ``.md`` link against the linking document's directory.
+
+    Percent-escapes in the path are decoded, so the result is the real file
+    path. Returns it relative to the base directory, with any ``#fragment``
+    kept, or ``None`` for external, absolute, non-markdown and out-of-tree
+    links.
+    """
+    # Most links in a document are not markdown links; skip parsing those
+    if '.md' not in href and '%' not in href:
+        return None
+    parts = urlsplit(href)
+    path = unquote(parts.path)
+    if parts.scheme or parts.netloc or parts.query or not path.endswith('.md'):
+        return None
+    if path.startswith('/'):
+        return None
+
+    resolved = posixpath.normpath(posixpath.join(source_directory, path))
+    if resolved == '..' or resolved.startswith('../'):
+        return None
+    return f"{resolved}#{parts.fragment}" if parts.fragment else resolved
+
+
+class RelativeLinkProcessor(Treeprocessor):
+    """Rewrite relative markdown links to the content API and record them."""
+
+    def __init__(self, md: Markdown, extension: "RelativeLinkExtension"):
+        super().__init__(md)
+        self.extension = extension
+
+    def run(self, root: Any) -> None:
+        source_directory = self.extension.source_directory
+        links = self.extension.links
+        # The source directory is fixed for one conversion, so repeated
+        # hrefs resolve to the same (path, new href)
+        rewritten: Dict[str, Optional[Tuple[str, str]]] = {}
+        for element in root.iter('a'):
+            href = element.get('href')
+            if not href:
+                continue
+            if href in rewritten:
+                target = rewritten[href]
+            else:
+                target = rewritten[href] = self._rewrite(href, source_directory)
+            if target is None:
+                continue
+
+            path, new_href = target
+            links.append(path)
+            element.set('href', new_href)
+
+    def _rewrite(self, href: str, source_directory: str) -> Optional[Tuple[str, str]]:
+        """Return the linked path and its content API href, or ``None``."""
+        resolved = resolve_link(href, source_directory)
+        if resolved is None:
+            return None
+        path, _, fragment = resolved.partition('#')
+        url = CONTENT_ENDPOINT + quote(path, safe='/') + self.extension.root_query
+        return path, f"{url}#{fragment}" if fragment else url
+
+
+class RelativeLinkExtension(Extension):
+    """Resolve links during rendering instead of post-processing the HTML.
+
+    Set :attr:`source_directory` to the rendered document's directory
+    (relative to the base directory) before each conversion; the resolved
+    targets are collected in :attr:`links` until the processor is reset.
+    Links rendered for a non-default ``root`` keep pointing into that root.
+    """
+
+    def __init__(self, root: Optional[str] = None, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.root_query = f"&root={quote(root, safe='')}" if root else ""
+        self.source_directory = ""
+        self.links: List[str] = []
+
+    def extendMarkdown(self, md: Markdown) -> None:
+        md.registerExtension(self)
+        # Run after the inline processor has created the <a> elements
+        md.treeprocessors.register(RelativeLinkProcessor(md, self), 'relative_links', 15)
+
+    def reset(self) -> None:
+        self.source_directory = ""
+        self.links = []
@@ -1,34 +1,78 @@
 """Service for handling markdown files and rendering."""
-import re
+import heapq
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Optional
-import markdown
-from markdown.extensions import codehilite, toc, tables
-import frontmatter
-from ..models import MarkdownContent, FileInfo, DirectoryInfo
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from ..models import MarkdownContent, FileInfo, DirectoryInfo, derive_title
+from .catalog import DocumentCatalog, DirectoryIndex, SORT_KEYS
+from .singleflight import SingleFlight
+
+# Directory listings kept in memory per service
+MAX_DIRECTORY_INDEXES = 256
 
 
 class MarkdownService:
     """Service for parsing and rendering markdown files."""
     
-    def __init__(self, base_directory: Path):
-        """Initialize the service with a base directory."""
+    def __init__(self, base_directory: Path, root: Optional[str] = None):
+        """Initialize the service with a base directory.
+        
+        ``root`` names the knowledge-base root this service serves; rendered
+        links carry it so they resolve within the same root. Leave it unset
+        for the default root.
+        """
         self.base_directory = Path(base_directory).resolve()
-        self.markdown_processor = markdown.Markdown(
-            extensions=[
-                'codehilite',
-                'toc',
-                'tables',
-                'fenced_code',
-                'nl2br'
-            ],
-            extension_configs={
-                'codehilite': {
-                    'css_class': 'highlight',
-                    'use_pygments': True
+        self.root = root
+        self._markdown_processor = None
+        self._link_extension: Any = None
+        
+        # The markdown processor and catalog are not safe for concurrent use
+        self._render_lock = threading.Lock()
+        self._search_lock = threading.Lock()
+        self.catalog = DocumentCatalog(self.base_directory)
+        
+        # Set while a background warm-up builds the catalog
+        self.warming = False
+        self.index_ready = threading.Event()
+        self.indexed = 0
+        self.index_total: Optional[int] = None
+        self.warmup_error: Optional[str] = None
+        
+        # Concurrent requests for the same file version share one computation
+        self.render_flight = SingleFlight()
+        self.listing_flight = SingleFlight()
+        self._index_lock = threading.Lock()
+        self._directory_indexes: "OrderedDict[Path, DirectoryIndex]" = OrderedDict()
+    
+    @property
+    def markdown_processor(self) -> Any:
+        """The markdown processor, built on first use.
+        
+        Importing markdown and Pygments is deferred until the first render so
+        that creating the service stays cheap.
+        """
+        if self._markdown_processor is None:
+            import markdown
+            from .links import RelativeLinkExtension
+            self._link_extension = RelativeLinkExtension(root=self.root)
+            self._markdown_processor = markdown.Markdown(
+                extensions=[
+                    'codehilite',
+                    'toc',
+                    'tables',
+                    'fenced_code',
+                    'nl2br',
+                    self._link_extension
+                ],
+                extension_configs={
+                    'codehilite': {
+                        'css_class': 'highlight',
+                        'use_pygments': True
+                    }
                 }
-            }
-        )
+            )
+        return self._markdown_processor
     
     def _validate_path(self, path: Path) -> Path:
         """Validate that the path is within the base directory."""
@@ -39,34 +83,6 @@ class MarkdownService:
         except ValueError:
             raise ValueError(f"Path traversal detected: {path}")
     
-    def _convert_relative_links(self, html_content: str) -> str:
-        """Convert relative markdown links to API endpoints."""
-        # Pattern to match markdown links: [text](./path.md) or [text](path.md)
-        def replace_link(match):
-            link_text = match.group(1)
-            link_url = match.group(2)
-            
-            # Skip external links (http/https)
-            if link_url.startswith(('http://', 'https://')):
-                return match.group(0)
-            
-            # Convert relative markdown links to API endpoints
-            if link_url.endswith('.md'):
-                # Remove leading ./ if present
-                clean_path = link_url.lstrip('./')
-                return f'<a href="/api/content?path={clean_path}">{link_text}</a>'
-            
-            return match.group(0)
-        
-        # Replace <a href="...">...</a> tags
-        html_content = re.sub(
-            r'<a href="([^"]*\.md)"[^>]*>([^<]*)</a>',
-            lambda m: f'<a href="/api/content?path={m.group(1).lstrip("./")}">{m.group(2)}</a>',
-            html_content
-        )
-        
-        return html_content
-    
     def parse_markdown(self, file_path: Path) -> MarkdownContent:
         """Parse a markdown file and return MarkdownContent."""
         validated_path = self._validate_path(file_path)
@@ -74,73 +90,218 @@ class MarkdownService:
         if not validated_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         
+        stat = validated_path.stat()
+        return self.render_flight.do(
+            (validated_path, stat.st_mtime_ns, stat.st_size),
+            lambda: self._render(validated_path)
+        )
+    
+    def _render(self, validated_path: Path) -> MarkdownContent:
+        """Read and render a validated markdown file."""
+        import frontmatter
+        
         # Read and parse frontmatter
         with open(validated_path, 'r', encoding='utf-8') as f:
             post = frontmatter.load(f)
         
         raw_content = post.content
         metadata = post.metadata
-        
-        # Convert markdown to HTML
-        html_content = self.markdown_processor.convert(raw_content)
-        
-        # Convert relative links
-        html_content = self._convert_relative_links(html_content)
-        
-        # Reset the markdown processor for next use
-        self.markdown_processor.reset()
-        
         relative_path = str(validated_path.relative_to(self.base_directory))
         
+        with self._render_lock:
+            markdown_processor = self.markdown_processor
+            
+            # Relative links are resolved against the document's directory
+            self._link_extension.source_directory = "/".join(
+                validated_path.parent.relative_to(self.base_directory).parts
+            )
+            
+            try:
+                # Convert markdown to HTML
+                html_content = markdown_processor.convert(raw_content)
+                links = self._link_extension.links
+            finally:
+                # Reset the markdown processor for next use
+                markdown_processor.reset()
+        
         return MarkdownContent(
             raw_content=raw_content,
             html_content=html_content,
             frontmatter=metadata,
-            file_path=relative_path
+            file_path=relative_path,
+            links=links
         )
     
-    def get_file_list(self, directory_path: str = ".") -> List[FileInfo]:
-        """Get list of files in a directory."""
+    def _get_directory_index(self, directory_path: str) -> DirectoryIndex:
+        """Return the cached index for a directory, rebuilding it if it changed."""
         dir_path = Path(directory_path) if directory_path != "." else Path(".")
         validated_path = self._validate_path(dir_path)
         
         if not validated_path.exists() or not validated_path.is_dir():
             raise FileNotFoundError(f"Directory not found: {directory_path}")
         
-        files = []
-        for item in validated_path.iterdir():
-            # Skip hidden files
-            if item.name.startswith('.'):
-                continue
-            
-            # Include markdown files and directories
-            if item.is_dir() or item.suffix == '.md':
-                files.append(FileInfo.from_path(item, self.base_directory))
+        version = validated_path.stat().st_mtime_ns
+        with self._index_lock:
+            index = self._directory_indexes.get(validated_path)
+            if index is not None and index.version == version:
+                self._directory_indexes.move_to_end(validated_path)
+                return index
+        
+        index = self.listing_flight.do(
+            (validated_path, version),
+            lambda: DirectoryIndex.build(validated_path, self.base_directory, version)
+        )
+        with self._index_lock:
+            self._directory_indexes[validated_path] = index
+            self._directory_indexes.move_to_end(validated_path)
+            if len(self._directory_indexes) > MAX_DIRECTORY_INDEXES:
+                self._directory_indexes.popitem(last=False)
+        return index
+    
+    def get_file_list(self, directory_path: str = ".") -> List[FileInfo]:
+        """Get list of files in a directory."""
+        index = self._get_directory_index(directory_path)
         
         # Sort: directories first, then files, both alphabetically
-        files.sort(key=lambda x: (not x.is_directory, x.name.lower()))
+        return [entry for _, entry in index.scan()]
+    
+    def iter_directory(
+        self,
+        directory_path: str = ".",
+        sort: str = "name",
+        descending: bool = False,
+        name_filter: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> Iterator[Tuple[int, FileInfo]]:
+        """Iterate over a directory listing in sorted order.
         
-        return files
+        Yields ``(next_cursor, entry)`` pairs; ``name_filter`` keeps entries
+        whose name contains it, case-insensitively.
+        """
+        index = self._get_directory_index(directory_path)
+        return self._scan_index(index, sort, descending, name_filter, cursor)
     
-    def get_directory_info(self, directory_path: str = ".") -> DirectoryInfo:
-        """Get detailed information about a directory."""
+    def _scan_index(
+        self,
+        index: DirectoryIndex,
+        sort: str,
+        descending: bool,
+        name_filter: Optional[str],
+        cursor: Optional[str]
+    ) -> Iterator[Tuple[int, FileInfo]]:
+        """Validate the listing options and scan ``index`` from ``cursor``."""
+        if sort not in SORT_KEYS:
+            raise ValueError(f"Invalid sort key: {sort}")
+        
+        start = 0
+        if cursor:
+            try:
+                start = int(cursor)
+            except ValueError:
+                raise ValueError(f"Invalid cursor: {cursor}")
+            if start < 0:
+                raise ValueError(f"Invalid cursor: {cursor}")
+        
+        return index.scan(sort, descending, name_filter, start)
+    
+    def get_directory_info(
+        self,
+        directory_path: str = ".",
+        sort: str = "name",
+        descending: bool = False,
+        name_filter: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> DirectoryInfo:
+        """Get detailed information about a directory.
+        
+        With ``limit`` only one page of entries is returned, along with the
+        cursor for the next page.
+        """
         dir_path = Path(directory_path) if directory_path != "." else Path(".")
         validated_path = self._validate_path(dir_path)
         
-        if not validated_path.exists() or not validated_path.is_dir():
-            raise FileNotFoundError(f"Directory not found: {directory_path}")
-        
-        files = self.get_file_list(directory_path)
+        index = self._get_directory_index(directory_path)
+        entries = self._scan_index(index, sort, descending, name_filter, cursor)
+        files = []
+        next_cursor = None
+        for position, entry in entries:
+            if limit is not None and len(files) == limit:
+                next_cursor = str(position - 1)
+                break
+            files.append(entry)
         
         return DirectoryInfo(
             name=validated_path.name if validated_path.name else ".",
             path=directory_path,
-            files=files
+            files=files,
+            total=index.count(name_filter),
+            next_cursor=next_cursor
         )
     
-    def search_content(self, query: str) -> List[dict]:
-        """Search for content across all markdown files."""
-        results = []
+    def warm_up(self, progress: Optional[Callable[[int, int], None]] = None) -> None:
+        """Build the markdown processor and the document catalog.
+        
+        While this runs, searches fall back to scanning the files directly
+        instead of waiting for the catalog.
+        """
+        def report(indexed: int, total: int) -> None:
+            self.indexed = indexed
+            self.index_total = total
+            if progress is not None:
+                progress(indexed, total)
+        
+        self.warming = True
+        try:
+            with self._render_lock:
+                self.markdown_processor
+            with self._search_lock:
+                self.catalog.refresh(report)
+            self.index_ready.set()
+        finally:
+            self.warming = False
+    
+    def index_status(self) -> Dict[str, Any]:
+        """Report catalog warm-up progress."""
+        return {
+            "ready": self.index_ready.is_set(),
+            "indexed": self.indexed,
+            "total": self.index_total,
+            "error": self.warmup_error
+        }
+    
+    def search_content(self, query: str, limit: Optional[int] = None) -> List[dict]:
+        """Search for content across all markdown files.
+        
+        Results are ordered by descending score; ``limit`` keeps only the
+        top-scoring matches.
+        """
+        if self.warming and not self.index_ready.is_set():
+            return self._rank(query, limit, self._scan_documents())
+        
+        with self._search_lock:
+            self.catalog.refresh()
+            self.index_ready.set()
+            return self._rank(query, limit, self._catalog_documents())
+    
+    def _catalog_documents(self) -> Iterator[Tuple[str, str, str, Callable[[], Dict[str, Any]]]]:
+        """Yield ``(path, title, raw_content, load_frontmatter)`` from the catalog."""
+        for index in self.catalog:
+            try:
+                raw_content = self.catalog.read_body(index)
+            except Exception:
+                # Skip files that can't be read
+                continue
+            yield (
+                self.catalog.path(index),
+                self.catalog.title(index),
+                raw_content,
+                lambda index=index: self.catalog.read_frontmatter(index)
+            )
+    
+    def _scan_documents(self) -> Iterator[Tuple[str, str, str, Callable[[], Dict[str, Any]]]]:
+        """Yield ``(path, title, raw_content, load_frontmatter)`` by walking the files."""
+        import frontmatter
         
         def search_in_directory(directory: Path):
             for item in directory.iterdir():
@@ -148,28 +309,64 @@ class MarkdownService:
                     continue
                 
                 if item.is_dir():
-                    search_in_directory(item)
+                    yield from search_in_directory(item)
                 elif item.suffix == '.md':
                     try:
-                        content = self.parse_markdown(item.relative_to(self.base_directory))
-                        
-                        # Search in title, content, and frontmatter
-                        if (query.lower() in content.title.lower() or
-                            query.lower() in content.raw_content.lower() or
-                            any(query.lower() in str(v).lower() for v in content.frontmatter.values())):
-                            
-                            results.append({
-                                'path': content.file_path,
-                                'title': content.title,
-                                'excerpt': self._get_excerpt(content.raw_content, query)
-                            })
+                        with open(item, 'r', encoding='utf-8') as f:
+                            post = frontmatter.load(f)
                     except Exception:
                         # Skip files that can't be parsed
                         continue
+                    
+                    relative_path = "/".join(item.relative_to(self.base_directory).parts)
+                    title = derive_title(post.metadata, post.content, relative_path)
+                    yield relative_path, title, post.content, lambda post=post: post.metadata
         
-        search_in_directory(self.base_directory)
+        return search_in_directory(self.base_directory)
+    
+    def _rank(
+        self,
+        query: str,
+        limit: Optional[int],
+        documents: Iterator[Tuple[str, str, str, Callable[[], Dict[str, Any]]]]
+    ) -> List[dict]:
+        """Score documents against ``query`` and return matches by descending score."""
+        results = []
+        query_lower = query.lower()
+        
+        for path, title, raw_content, load_frontmatter in documents:
+            try:
+                # Search in title, content, and frontmatter
+                score = 10 if query_lower in title.lower() else 0
+                score += raw_content.lower().count(query_lower)
+                if not score:
+                    metadata = load_frontmatter()
+                    if any(query_lower in str(v).lower() for v in metadata.values()):
+                        score = 1
+            except Exception:
+                # Skip files that can't be parsed
+                continue
+            
+            if score:
+                results.append({
+                    'path': path,
+                    'title': title,
+                    'excerpt': self._get_excerpt(raw_content, query),
+                    'score': score
+                })
+        
+        if limit is not None:
+            return heapq.nlargest(limit, results, key=lambda r: r['score'])
+        results.sort(key=lambda r: r['score'], reverse=True)
         return results
     
+    def metrics(self) -> Dict[str, Any]:
+        """Return single-flight coalescing statistics."""
+        return {
+            "render": self.render_flight.stats(),
+            "listing": self.listing_flight.stats()
+        }
+    
     def _get_excerpt(self, content: str, query: str, context_length: int = 100) -> str:
         """Get an excerpt around the search query."""
         content_lower = content.lower()
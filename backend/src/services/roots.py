@@ -0,0 +1,130 @@
+"""Registry of named knowledge-base roots served by one process."""
+import heapq
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional
+from .markdown_service import MarkdownService
+from .singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+
+class RootRegistry:
+    """Named knowledge-base roots, each backed by its own MarkdownService.
+    
+    Every root keeps its own path-validation boundary and catalog, while
+    cross-root searches share a single worker pool. Warm-up runs on a
+    separate single worker so it never starves searches.
+    """
+    
+    def __init__(self, roots: Mapping[str, Path], max_workers: Optional[int] = None):
+        """Create a service per root; the first root is the default."""
+        if not roots:
+            raise ValueError("At least one root directory is required")
+        self.default_name = next(iter(roots))
+        self.services: Dict[str, MarkdownService] = {
+            name: MarkdownService(directory, None if name == self.default_name else name)
+            for name, directory in roots.items()
+        }
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers or min(32, len(self.services) + 4),
+            thread_name_prefix="serve-md"
+        )
+        self.warmup_executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="serve-md-warmup"
+        )
+        self.search_flight = SingleFlight()
+        self.warmup_seconds: Optional[float] = None
+    
+    @property
+    def names(self) -> List[str]:
+        """Root names in registration order."""
+        return list(self.services)
+    
+    def get(self, name: Optional[str] = None) -> MarkdownService:
+        """Return the service for ``name``, or the default root if omitted."""
+        if name is None:
+            name = self.default_name
+        try:
+            return self.services[name]
+        except KeyError:
+            raise KeyError(f"Root not found: {name}")
+    
+    def search(self, query: str, limit: int) -> List[dict]:
+        """Search every root in parallel and return the global top ``limit`` results.
+        
+        Identical concurrent searches share a single fan-out.
+        """
+        return self.search_flight.do((query, limit), lambda: self._search(query, limit))
+    
+    def _search(self, query: str, limit: int) -> List[dict]:
+        """Fan a search out to every root and merge the per-root top-k lists."""
+        def search_root(name: str) -> List[dict]:
+            results = self.services[name].search_content(query, limit)
+            return [{**result, 'root': name} for result in results]
+        
+        # Each root returns its own top-k, already sorted by descending score
+        per_root = list(self.executor.map(search_root, self.services))
+        merged = heapq.merge(*per_root, key=lambda r: r['score'], reverse=True)
+        return list(islice(merged, limit))
+    
+    def start_warmup(self) -> List[Future]:
+        """Warm up every root in the background.
+        
+        Searches degrade to scanning the files of a root until its catalog
+        is ready. A failed warm-up is logged and reported by
+        :meth:`readiness`.
+        """
+        started = time.perf_counter()
+        remaining = len(self.services)
+        lock = threading.Lock()
+        
+        def warm_up(name: str, service: MarkdownService) -> None:
+            nonlocal remaining
+            try:
+                service.warm_up()
+            except Exception as e:
+                # Recorded here rather than in a done-callback so the error is
+                # visible as soon as the future completes
+                logger.error("Warm-up failed for root '%s'", name, exc_info=e)
+                service.warmup_error = f"{type(e).__name__}: {e}"
+                raise
+            finally:
+                with lock:
+                    remaining -= 1
+                    if not remaining:
+                        self.warmup_seconds = time.perf_counter() - started
+        
+        futures = []
+        for name, service in self.services.items():
+            # Mark the root as warming before its task gets a worker
+            service.warming = True
+            futures.append(self.warmup_executor.submit(warm_up, name, service))
+        return futures
+    
+    def readiness(self) -> Dict[str, Any]:
+        """Report whether every root's catalog has been built, or failed to build."""
+        roots = {name: service.index_status() for name, service in self.services.items()}
+        return {
+            "ready": all(status["ready"] for status in roots.values()),
+            "failed": any(status["error"] for status in roots.values()),
+            "warmup_seconds": self.warmup_seconds,
+            "roots": roots
+        }
+    
+    def metrics(self) -> Dict[str, Any]:
+        """Return coalescing statistics for search and for every root."""
+        return {
+            "search": self.search_flight.stats(),
+            "roots": {name: service.metrics() for name, service in self.services.items()}
+        }
+    
+    def close(self) -> None:
+        """Shut down the worker pools."""
+        self.warmup_executor.shutdown(wait=False)
+        self.executor.shutdown(wait=False)
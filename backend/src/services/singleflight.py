@@ -0,0 +1,71 @@
+"""Single-flight coalescing of concurrent identical computations."""
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    """An in-flight computation that followers wait on."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Run at most one computation per key at a time.
+
+    Callers that arrive while a computation for the same key is running wait
+    for it and share its result (or exception) instead of repeating the work.
+    Nothing is cached once the computation finishes.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty group."""
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Return ``fn()``, sharing the result with concurrent callers of ``key``."""
+        with self._lock:
+            self.calls += 1
+            call = self._calls.get(key)
+            if call is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def stats(self) -> Dict[str, Any]:
+        """Return call counts and the fraction of calls that were coalesced."""
+        with self._lock:
+            calls, coalesced = self.calls, self.coalesced
+        return {
+            "calls": calls,
+            "coalesced": coalesced,
+            "coalescing_rate": coalesced / calls if calls else 0.0,
+        }
@@ -0,0 +1,5 @@
+"""Start-up timing for the serve-md command line."""
+import time
+
+# Recorded when the ``src`` package is first imported
+IMPORT_STARTED = time.perf_counter()
@@ -1,9 +1,13 @@
 """Tests for the FastAPI application."""
+import json
+import subprocess
+import sys
+import time
 import pytest
 import tempfile
 from pathlib import Path
 from fastapi.testclient import TestClient
-from src.main import create_app
+from src.main import create_app, parse_roots
 
 
 class TestAPI:
@@ -87,6 +91,31 @@ Welcome to the knowledge base!
         response = client.get("/api/directory?path=nonexistent")
         assert response.status_code == 404
     
+    def test_get_directory_paginated(self, client):
+        """Test paging through a directory listing."""
+        first = client.get("/api/directory?limit=2").json()
+        assert [f["name"] for f in first["files"]] == ["market", "technical"]
+        assert first["total"] == 3
+        
+        second = client.get(f"/api/directory?limit=2&cursor={first['next_cursor']}").json()
+        assert [f["name"] for f in second["files"]] == ["README.md"]
+        assert second["next_cursor"] is None
+    
+    def test_get_directory_invalid_options(self, client):
+        """Test that invalid listing options are rejected."""
+        assert client.get("/api/directory?sort=color").status_code == 422
+        assert client.get("/api/directory?cursor=abc").status_code == 400
+    
+    def test_get_directory_stream(self, client):
+        """Test streaming a directory listing as NDJSON."""
+        response = client.get("/api/directory?path=technical&stream=true&order=desc")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        
+        entries = [json.loads(line) for line in response.text.splitlines()]
+        assert [e["name"] for e in entries] == ["study1.md", "README.md"]
+        assert entries[0]["path"] == "technical/study1.md"
+    
     def test_get_content_root_readme(self, client):
         """Test getting the root README content."""
         response = client.get("/api/content?path=README.md")
@@ -142,10 +171,163 @@ Welcome to the knowledge base!
         assert response.status_code == 200
         assert response.json()["status"] == "healthy"
     
+    def test_metrics(self, client):
+        """Test that coalescing statistics are reported."""
+        client.get("/api/content?path=README.md")
+        client.get("/api/search?q=technical")
+        
+        response = client.get("/api/metrics")
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert data["search"]["calls"] == 1
+        (root_metrics,) = data["roots"].values()
+        assert root_metrics["render"]["calls"] == 1
+        assert set(root_metrics["listing"]) == {"calls", "coalesced", "coalescing_rate"}
+    
+    def test_ready_after_warmup(self, sample_knowledge_base):
+        """Test that /ready reports the background warm-up."""
+        app = create_app(sample_knowledge_base)
+        with TestClient(app) as client:
+            deadline = time.monotonic() + 5
+            response = client.get("/ready")
+            while response.status_code == 503 and time.monotonic() < deadline:
+                time.sleep(0.01)
+                response = client.get("/ready")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "ready"
+        (root_status,) = data["roots"].values()
+        assert root_status == {"ready": True, "indexed": 4, "total": 4, "error": None}
+    
+    def test_ready_despite_broken_document(self, sample_knowledge_base):
+        """Test that one unparseable document does not fail the root's warm-up."""
+        (sample_knowledge_base / "broken.md").write_text("---\ntitle: [unclosed\n---\n\n# Broken")
+        (sample_knowledge_base / "binary.md").write_bytes(b"\xff\xfe\x00 not utf-8")
+        app = create_app(sample_knowledge_base)
+        with TestClient(app) as client:
+            deadline = time.monotonic() + 5
+            response = client.get("/ready")
+            while response.status_code == 503 and time.monotonic() < deadline:
+                time.sleep(0.01)
+                response = client.get("/ready")
+            search = client.get("/api/search?q=technical")
+        
+        assert response.status_code == 200
+        (root_status,) = response.json()["roots"].values()
+        assert root_status["ready"] is True
+        assert root_status["error"] is None
+        assert search.status_code == 200
+        assert search.json()
+    
+    def test_create_app_defers_heavy_imports(self, sample_knowledge_base):
+        """Test that markdown, Pygments and frontmatter are imported lazily."""
+        code = (
+            "import sys; from pathlib import Path; from src.main import create_app; "
+            f"create_app(Path({str(sample_knowledge_base)!r})); "
+            "print(sorted({'markdown', 'pygments', 'frontmatter'} & set(sys.modules)))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).parent.parent,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        assert result.stdout.strip() == "[]"
+    
     def test_cors_headers(self, client):
         """Test that CORS headers are present for preflight requests."""
         # Test that the app handles CORS (middleware is configured)
         # For actual CORS testing, we'd need a real browser or more complex setup
         # For now, just verify the endpoint works
         response = client.get("/api/directory")
-        assert response.status_code == 200
\ No newline at end of file
+        assert response.status_code == 200
+
+class TestMultipleRoots:
+    """Test serving several knowledge-base roots from one app."""
+    
+    @pytest.fixture
+    def client(self):
+        """Create a test client with two roots."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base = Path(temp_dir)
+            engineering = base / "engineering"
+            engineering.mkdir()
+            (engineering / "README.md").write_text("# Engineering\n\nShared runbook link.")
+            ops = base / "ops"
+            ops.mkdir()
+            (ops / "README.md").write_text("# Ops\n\nRunbook index.")
+            (ops / "incident.md").write_text("# Incident\n\nFollow the [runbook](README.md).")
+            
+            app = create_app({"engineering": engineering, "ops": ops})
+            yield TestClient(app)
+    
+    def test_list_roots(self, client):
+        """Test listing the configured roots."""
+        response = client.get("/api/roots")
+        assert response.status_code == 200
+        assert response.json() == [
+            {"name": "engineering", "default": True},
+            {"name": "ops", "default": False},
+        ]
+    
+    def test_directory_per_root(self, client):
+        """Test that directory listings are namespaced per root."""
+        default = client.get("/api/directory").json()
+        ops = client.get("/api/directory?root=ops").json()
+        
+        assert [f["name"] for f in default["files"]] == ["README.md"]
+        assert [f["name"] for f in ops["files"]] == ["incident.md", "README.md"]
+    
+    def test_content_per_root(self, client):
+        """Test that content is namespaced per root."""
+        response = client.get("/api/content?root=ops&path=README.md")
+        assert response.status_code == 200
+        assert response.json()["title"] == "Ops"
+    
+    def test_content_links_stay_in_root(self, client):
+        """Test that links rendered in a non-default root carry the root."""
+        data = client.get("/api/content?root=ops&path=incident.md").json()
+        assert 'href="/api/content?path=README.md&amp;root=ops"' in data["html_content"]
+        
+        response = client.get("/api/content?path=README.md&root=ops")
+        assert response.json()["title"] == "Ops"
+    
+    def test_unknown_root(self, client):
+        """Test that unknown roots return 404."""
+        response = client.get("/api/directory?root=product")
+        assert response.status_code == 404
+    
+    def test_search_all_roots(self, client):
+        """Test that search spans every root."""
+        response = client.get("/api/search?q=runbook")
+        assert response.status_code == 200
+        
+        found = {(r["root"], r["path"]) for r in response.json()}
+        assert found == {
+            ("engineering", "README.md"),
+            ("ops", "README.md"),
+            ("ops", "incident.md"),
+        }
+    
+    def test_search_limit(self, client):
+        """Test limiting the number of search results."""
+        response = client.get("/api/search?q=runbook&limit=1")
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+
+
+class TestParseRoots:
+    """Test parsing --directory values."""
+    
+    def test_named_and_unnamed_roots(self, tmp_path):
+        """Test name=path and bare path values."""
+        roots = parse_roots([f"eng={tmp_path}", str(tmp_path / "ops")])
+        assert roots == {"eng": tmp_path.resolve(), "ops": (tmp_path / "ops").resolve()}
+    
+    def test_duplicate_root_names(self, tmp_path):
+        """Test that duplicate root names are rejected."""
+        with pytest.raises(ValueError, match="Duplicate root name"):
+            parse_roots([f"docs={tmp_path}", f"docs={tmp_path}"])
@@ -0,0 +1,151 @@
+"""Tests for the document catalog."""
+import os
+import pytest
+import tempfile
+import threading
+from pathlib import Path
+from src.services import catalog as catalog_module
+from src.services.catalog import DocumentCatalog, DirectoryIndex
+
+
+class TestDocumentCatalog:
+    """Test DocumentCatalog."""
+    
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for testing."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yield Path(temp_dir)
+    
+    @pytest.fixture
+    def catalog(self, temp_dir):
+        """Create a populated DocumentCatalog."""
+        (temp_dir / "README.md").write_text("""---
+title: "Knowledge Base"
+tags: ["index"]
+---
+
+# Welcome
+
+Top level page.
+""")
+        guides = temp_dir / "guides"
+        guides.mkdir()
+        (guides / "setup.md").write_text("# Setup Guide\n\nInstall things.")
+        (guides / "empty.md").write_text("")
+        (temp_dir / ".hidden.md").write_text("# Hidden")
+        (temp_dir / "notes.txt").write_text("Not markdown")
+        
+        catalog = DocumentCatalog(temp_dir)
+        catalog.refresh()
+        return catalog
+    
+    def test_refresh_indexes_markdown_files(self, catalog):
+        """Test that only visible markdown files are indexed."""
+        paths = [catalog.path(i) for i in catalog]
+        assert paths == ["README.md", "guides/empty.md", "guides/setup.md"]
+    
+    def test_titles(self, catalog):
+        """Test that titles follow the MarkdownContent rules."""
+        titles = {catalog.path(i): catalog.title(i) for i in catalog}
+        assert titles["README.md"] == "Knowledge Base"
+        assert titles["guides/setup.md"] == "Setup Guide"
+        assert titles["guides/empty.md"] == "Empty"
+    
+    def test_read_body_skips_frontmatter(self, catalog):
+        """Test that bodies are read from disk without the frontmatter block."""
+        assert catalog.read_body(0) == "# Welcome\n\nTop level page."
+        assert catalog.read_body(1) == ""
+        assert catalog.read_body(2) == "# Setup Guide\n\nInstall things."
+    
+    def test_read_frontmatter(self, catalog):
+        """Test that frontmatter is parsed on demand."""
+        assert catalog.read_frontmatter(0) == {"title": "Knowledge Base", "tags": ["index"]}
+        assert catalog.read_frontmatter(2) == {}
+    
+    def test_file_info(self, catalog):
+        """Test materializing FileInfo from the columns."""
+        info = catalog.file_info(2)
+        assert info.name == "setup.md"
+        assert info.path == "guides/setup.md"
+        assert info.is_directory is False
+        assert info.size == len("# Setup Guide\n\nInstall things.")
+    
+    def test_refresh_picks_up_changes(self, catalog, temp_dir):
+        """Test that refresh re-reads changed files and drops deleted ones."""
+        setup = temp_dir / "guides" / "setup.md"
+        setup.write_text("# Setup Guide v2\n\nInstall more things.")
+        stat = setup.stat()
+        os.utime(setup, (stat.st_atime, stat.st_mtime + 10))
+        (temp_dir / "guides" / "empty.md").unlink()
+        (temp_dir / "new.md").write_text("# New Page")
+        
+        catalog.refresh()
+        
+        titles = {catalog.path(i): catalog.title(i) for i in catalog}
+        assert titles == {
+            "README.md": "Knowledge Base",
+            "guides/setup.md": "Setup Guide v2",
+            "new.md": "New Page",
+        }
+    
+    def test_refresh_skips_dangling_symlinks(self, catalog, temp_dir):
+        """Test that files that cannot be stat'd are skipped."""
+        (temp_dir / "broken.md").symlink_to(temp_dir / "missing.md")
+        
+        catalog.refresh()
+        
+        paths = [catalog.path(i) for i in catalog]
+        assert "broken.md" not in paths
+        assert "README.md" in paths
+    
+    def test_refresh_skips_invalid_frontmatter(self, catalog, temp_dir):
+        """Test that a document with malformed YAML frontmatter is skipped."""
+        (temp_dir / "broken.md").write_text("---\ntitle: [unclosed\n---\n\n# Broken")
+        
+        catalog.refresh()
+        
+        paths = [catalog.path(i) for i in catalog]
+        assert "broken.md" not in paths
+        assert "README.md" in paths
+    
+    def test_directory_index_interns_paths(self, temp_dir):
+        """Test that repeated listings share one path string per entry."""
+        (temp_dir / "docs").mkdir()
+        (temp_dir / "docs" / "guide.md").write_text("# Guide")
+        index = DirectoryIndex.build(temp_dir / "docs", temp_dir, 0)
+        
+        first = index.file_info(0).path
+        second = index.file_info(0).path
+        
+        assert first == "docs/guide.md"
+        assert first is second
+    
+    def test_directory_index_concurrent_scans(self, temp_dir, monkeypatch):
+        """Test that concurrent listings with re-stats see consistent entries."""
+        monkeypatch.setattr(catalog_module, "STATS_TTL", 0.0)
+        for i in range(50):
+            (temp_dir / f"doc-{i:02d}.md").write_text("x" * i)
+        index = DirectoryIndex.build(temp_dir, temp_dir, 0)
+        errors = []
+        
+        def list_entries(sort):
+            try:
+                for i in range(20):
+                    (temp_dir / f"doc-{i:02d}.md").write_text("y" * (100 - i))
+                    names = [entry.name for _, entry in index.scan(sort, i % 2 == 0, "doc")]
+                    assert len(names) == 50
+                    index.count(f"doc-{i:02d}")
+            except Exception as e:
+                errors.append(e)
+        
+        threads = [
+            threading.Thread(target=list_entries, args=(sort,))
+            for sort in ("name", "mtime", "size", "size")
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert errors == []
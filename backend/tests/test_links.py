@@ -0,0 +1,95 @@
+"""Tests for the relative link extension."""
+import markdown
+import pytest
+from src.services.links import RelativeLinkExtension, resolve_link
+
+
+class TestResolveLink:
+    """Test resolve_link."""
+    
+    @pytest.mark.parametrize("href, source_directory, expected", [
+        ("other.md", "", "other.md"),
+        ("./subdir/file.md", "", "subdir/file.md"),
+        ("../technical/architecture.md", "guides", "technical/architecture.md"),
+        ("page.md#section", "guides", "guides/page.md#section"),
+        ("my%20file.md", "guides", "guides/my file.md"),
+        ("notes%2Emd", "", "notes.md"),
+        ("https://example.com/page.md", "", None),
+        ("mailto:someone@example.com", "", None),
+        ("/absolute.md", "", None),
+        ("image.png", "", None),
+        ("#section", "", None),
+        ("../outside.md", "", None),
+    ])
+    def test_resolve_link(self, href, source_directory, expected):
+        """Test resolving hrefs against the source directory."""
+        assert resolve_link(href, source_directory) == expected
+
+
+class TestRelativeLinkExtension:
+    """Test RelativeLinkExtension."""
+    
+    @pytest.fixture
+    def extension(self):
+        """Create the extension."""
+        return RelativeLinkExtension()
+    
+    @pytest.fixture
+    def md(self, extension):
+        """Create a markdown processor using the extension."""
+        return markdown.Markdown(extensions=[extension])
+    
+    def test_rewrites_links_during_conversion(self, md, extension):
+        """Test that links are rewritten and recorded in one pass."""
+        extension.source_directory = "guides"
+        html = md.convert(
+            '[Setup](setup.md "Setup guide") and [**Architecture**](../technical/architecture.md#layers) '
+            'and [Site](https://example.com)'
+        )
+        
+        assert '<a href="/api/content?path=guides/setup.md" title="Setup guide">Setup</a>' in html
+        assert (
+            '<a href="/api/content?path=technical/architecture.md#layers">'
+            '<strong>Architecture</strong></a>'
+        ) in html
+        assert '<a href="https://example.com">Site</a>' in html
+        assert extension.links == ["guides/setup.md", "technical/architecture.md"]
+    
+    def test_links_keep_non_default_root(self):
+        """Test that links rendered for a named root stay in that root."""
+        extension = RelativeLinkExtension(root="ops team")
+        md = markdown.Markdown(extensions=[extension])
+        
+        html = md.convert("[Oncall](oncall.md#paging)")
+        
+        assert 'href="/api/content?path=oncall.md&amp;root=ops%20team#paging"' in html
+        assert extension.links == ["oncall.md"]
+    
+    def test_escaped_paths_are_quoted_once(self, md, extension):
+        """Test that percent-escaped links are decoded, recorded and re-quoted once."""
+        html = md.convert("[Notes](my%20file.md)")
+        
+        assert 'href="/api/content?path=my%20file.md"' in html
+        assert extension.links == ["my file.md"]
+    
+    def test_repeated_links_are_rewritten_alike(self, md, extension):
+        """Test that every occurrence of a repeated link is rewritten and recorded."""
+        extension.source_directory = "guides"
+        html = md.convert("[One](setup.md) [Two](setup.md) [Site](https://example.com)")
+        
+        assert html.count('href="/api/content?path=guides/setup.md"') == 2
+        assert extension.links == ["guides/setup.md", "guides/setup.md"]
+        
+        md.reset()
+        extension.source_directory = "other"
+        html = md.convert("[One](setup.md)")
+        assert 'href="/api/content?path=other/setup.md"' in html
+    
+    def test_reset_clears_state(self, md, extension):
+        """Test that resetting the processor clears the recorded links."""
+        extension.source_directory = "guides"
+        md.convert("[Setup](setup.md)")
+        md.reset()
+        
+        assert extension.links == []
+        assert extension.source_directory == ""
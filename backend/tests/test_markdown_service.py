@@ -3,6 +3,8 @@ import pytest
 import tempfile
 import os
 from pathlib import Path
+from src.services import catalog
+from src.services import markdown_service as markdown_service_module
 from src.services.markdown_service import MarkdownService
 from src.models import MarkdownContent
 
@@ -97,6 +99,21 @@ def hello():
         # External links should remain unchanged
         assert "https://example.com" in result.html_content
     
+    def test_links_resolved_from_subdirectory(self, markdown_service, temp_dir):
+        """Test that links are resolved against the linking document's directory."""
+        guides = temp_dir / "guides"
+        guides.mkdir()
+        (guides / "setup.md").write_text(
+            "# Setup\n\nSee [architecture](../technical/architecture.md#layers) "
+            "and [next steps](./next.md)."
+        )
+        
+        result = markdown_service.parse_markdown(Path("guides/setup.md"))
+        
+        assert 'href="/api/content?path=technical/architecture.md#layers"' in result.html_content
+        assert 'href="/api/content?path=guides/next.md"' in result.html_content
+        assert result.links == ["technical/architecture.md", "guides/next.md"]
+    
     def test_get_file_list(self, markdown_service, temp_dir):
         """Test getting list of markdown files."""
         # Create some test files
@@ -136,6 +153,150 @@ def hello():
         assert subdir_info.name == "subdir"
         assert any(f.name == "file2.md" for f in subdir_info.files)
     
+    @pytest.fixture
+    def large_directory(self, temp_dir):
+        """Create a directory with many files of different sizes and ages."""
+        (temp_dir / "zdir").mkdir()
+        (temp_dir / "adir").mkdir()
+        for i in range(25):
+            file_path = temp_dir / f"doc-{i:02d}.md"
+            file_path.write_text("x" * (100 - i))
+            os.utime(file_path, (1_000_000 + i, 1_000_000 + i))
+        return temp_dir
+    
+    def test_get_directory_info_pagination(self, markdown_service, large_directory):
+        """Test walking a directory page by page with cursors."""
+        seen = []
+        cursor = None
+        while True:
+            page = markdown_service.get_directory_info(".", cursor=cursor, limit=10)
+            seen.extend(f.name for f in page.files)
+            assert page.total == 27
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        
+        assert seen == [f.name for f in markdown_service.get_file_list()]
+        assert seen[:3] == ["adir", "zdir", "doc-00.md"]
+        assert len(seen) == 27
+    
+    def test_get_directory_info_sort(self, markdown_service, large_directory):
+        """Test sorting by size and modification time, directories first."""
+        by_size = markdown_service.get_directory_info(".", sort="size", limit=4)
+        assert [f.name for f in by_size.files][2:] == ["doc-24.md", "doc-23.md"]
+        
+        newest = markdown_service.get_directory_info(".", sort="mtime", descending=True, limit=3)
+        assert newest.files[0].is_directory and newest.files[1].is_directory
+        assert newest.files[2].name == "doc-24.md"
+        
+        with pytest.raises(ValueError, match="Invalid sort key"):
+            markdown_service.get_directory_info(".", sort="color")
+    
+    def test_get_directory_info_name_filter(self, markdown_service, large_directory):
+        """Test filtering by name with pagination."""
+        page = markdown_service.get_directory_info(".", name_filter="DOC-1", limit=4)
+        assert [f.name for f in page.files] == ["doc-10.md", "doc-11.md", "doc-12.md", "doc-13.md"]
+        
+        rest = markdown_service.get_directory_info(".", name_filter="doc-1", cursor=page.next_cursor)
+        assert [f.name for f in rest.files] == [f"doc-{i}.md" for i in range(14, 20)]
+        assert rest.next_cursor is None
+    
+    def test_get_directory_info_filtered_total(self, markdown_service, large_directory):
+        """Test that total counts the entries matching the filter."""
+        page = markdown_service.get_directory_info(".", name_filter="doc-1", limit=2)
+        assert page.total == 10
+    
+    def test_listing_reflects_in_place_edits(self, markdown_service, large_directory):
+        """Test that editing a file without touching the directory updates the listing."""
+        markdown_service.get_file_list()
+        markdown_service.get_directory_info(".", sort="size")
+        directory_mtime = large_directory.stat().st_mtime_ns
+        
+        target = large_directory / "doc-24.md"
+        with open(target, "a") as f:
+            f.write("y" * 5000)
+        os.utime(target, (2_000_000, 2_000_000))
+        os.utime(large_directory, ns=(directory_mtime, directory_mtime))
+        
+        files = {f.name: f for f in markdown_service.get_file_list()}
+        assert files["doc-24.md"].size == 76 + 5000
+        assert files["doc-24.md"].modified_time == 2_000_000
+        
+        by_size = markdown_service.get_directory_info(".", sort="size", descending=True, limit=3)
+        assert by_size.files[2].name == "doc-24.md"
+        newest = markdown_service.get_directory_info(".", sort="mtime", descending=True, limit=3)
+        assert newest.files[2].name == "doc-24.md"
+        assert markdown_service.listing_flight.calls == 1
+    
+    def test_sorted_listing_restats_on_schedule(self, markdown_service, large_directory, monkeypatch):
+        """Test that size-sorted pages only re-stat every entry once the TTL expires."""
+        markdown_service.get_directory_info(".", sort="size", descending=True, limit=3)
+        directory_mtime = large_directory.stat().st_mtime_ns
+        
+        target = large_directory / "doc-24.md"
+        with open(target, "a") as f:
+            f.write("y" * 5000)
+        os.utime(large_directory, ns=(directory_mtime, directory_mtime))
+        
+        cached = markdown_service.get_directory_info(".", sort="size", descending=True, limit=3)
+        assert cached.files[2].name == "doc-00.md"
+        
+        monkeypatch.setattr(catalog, "STATS_TTL", 0.0)
+        refreshed = markdown_service.get_directory_info(".", sort="size", descending=True, limit=3)
+        assert refreshed.files[2].name == "doc-24.md"
+        assert refreshed.files[2].size == 76 + 5000
+    
+    def test_directory_caches_are_bounded(self, markdown_service, temp_dir, monkeypatch):
+        """Test that cached directory indexes and filtered counts are evicted."""
+        monkeypatch.setattr(markdown_service_module, "MAX_DIRECTORY_INDEXES", 2)
+        monkeypatch.setattr(catalog, "MAX_MATCH_COUNTS", 2)
+        for name in ("a", "b", "c"):
+            (temp_dir / name).mkdir()
+            markdown_service.get_file_list(name)
+        assert len(markdown_service._directory_indexes) == 2
+        assert temp_dir / "a" not in markdown_service._directory_indexes
+        
+        index = markdown_service._get_directory_index(".")
+        for needle in ("a", "b", "c"):
+            index.count(needle)
+        assert list(index._match_counts) == ["b", "c"]
+    
+    def test_directory_index_is_cached(self, markdown_service, large_directory):
+        """Test that listings reuse the index until the directory changes."""
+        markdown_service.get_file_list()
+        markdown_service.get_file_list()
+        assert markdown_service.listing_flight.calls == 1
+        
+        (large_directory / "new.md").write_text("# New")
+        os.utime(large_directory, ns=(0, large_directory.stat().st_mtime_ns + 1_000_000))
+        assert "new.md" in [f.name for f in markdown_service.get_file_list()]
+        assert markdown_service.listing_flight.calls == 2
+    
+    def test_warm_up_builds_catalog(self, markdown_service, temp_dir):
+        """Test that warm-up indexes every document and reports progress."""
+        (temp_dir / "file1.md").write_text("# File 1")
+        (temp_dir / "file2.md").write_text("# File 2")
+        progress = []
+        
+        markdown_service.warm_up(lambda indexed, total: progress.append((indexed, total)))
+        
+        assert progress == [(0, 2), (1, 2), (2, 2)]
+        assert markdown_service.index_status() == {"ready": True, "indexed": 2, "total": 2, "error": None}
+        assert len(markdown_service.catalog) == 2
+        assert markdown_service.warming is False
+    
+    def test_search_scans_files_while_warming(self, markdown_service, temp_dir):
+        """Test that searches fall back to scanning before the catalog is ready."""
+        (temp_dir / "guide.md").write_text("---\ntags: [ops]\n---\n\n# Guide\n\nRead me.")
+        markdown_service.warming = True
+        
+        results = markdown_service.search_content("ops")
+        
+        assert [r["path"] for r in results] == ["guide.md"]
+        assert results[0]["title"] == "Guide"
+        assert len(markdown_service.catalog) == 0
+        assert not markdown_service.index_ready.is_set()
+    
     def test_file_not_found(self, markdown_service):
         """Test handling of non-existent files."""
         with pytest.raises(FileNotFoundError):
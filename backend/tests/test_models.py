@@ -76,4 +76,23 @@ class TestMarkdownContent:
             file_path="docs/test.md"
         )
         
-        assert content.frontmatter == {}
\ No newline at end of file
+        assert content.frontmatter == {}
+
+
+class TestSlots:
+    """Test that models are compact slotted dataclasses."""
+    
+    def test_models_have_no_instance_dict(self):
+        """Test that model instances do not carry a __dict__."""
+        file_info = FileInfo(name="test.md", path="test.md", is_directory=False, size=1)
+        content = MarkdownContent(
+            raw_content="# Hello",
+            html_content="<h1>Hello</h1>",
+            frontmatter={},
+            file_path="test.md"
+        )
+        
+        assert not hasattr(file_info, "__dict__")
+        assert not hasattr(content, "__dict__")
+        assert file_info.modified_time is None
+        assert content.title == "Hello"
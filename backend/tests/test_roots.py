@@ -0,0 +1,105 @@
+"""Tests for the root registry."""
+import logging
+import threading
+import pytest
+import tempfile
+from pathlib import Path
+from src.services.roots import RootRegistry
+
+
+class TestRootRegistry:
+    """Test RootRegistry."""
+    
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for testing."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yield Path(temp_dir)
+    
+    @pytest.fixture
+    def registry(self, temp_dir):
+        """Create a registry with two roots."""
+        engineering = temp_dir / "engineering"
+        engineering.mkdir()
+        (engineering / "deploy.md").write_text("# Deploy\n\nDeploy the service. Deploy often.")
+        (engineering / "style.md").write_text("# Style\n\nHow we write code.")
+        
+        ops = temp_dir / "ops"
+        ops.mkdir()
+        (ops / "oncall.md").write_text("# Oncall\n\nPage someone, then deploy a fix.")
+        (ops / "deploy-checklist.md").write_text("# Deploy Checklist\n\nBefore you deploy.")
+        
+        registry = RootRegistry({"engineering": engineering, "ops": ops})
+        yield registry
+        registry.close()
+    
+    def test_default_root(self, registry):
+        """Test that the first root is the default."""
+        assert registry.names == ["engineering", "ops"]
+        assert registry.get() is registry.get("engineering")
+    
+    def test_unknown_root(self, registry):
+        """Test that unknown roots raise KeyError."""
+        with pytest.raises(KeyError):
+            registry.get("product")
+    
+    def test_roots_are_isolated(self, registry):
+        """Test that each root has its own path-validation boundary."""
+        with pytest.raises(ValueError, match="Path traversal"):
+            registry.get("engineering").parse_markdown(Path("../ops/oncall.md"))
+    
+    def test_search_merges_all_roots(self, registry):
+        """Test that search results from every root are merged by score."""
+        results = registry.search("deploy", limit=10)
+        
+        assert {(r["root"], r["path"]) for r in results} == {
+            ("engineering", "deploy.md"),
+            ("ops", "oncall.md"),
+            ("ops", "deploy-checklist.md"),
+        }
+        scores = [r["score"] for r in results]
+        assert scores == sorted(scores, reverse=True)
+    
+    def test_search_limit_is_global(self, registry):
+        """Test that the limit applies to the merged result list."""
+        results = registry.search("deploy", limit=2)
+        
+        assert len(results) == 2
+        assert all(r["score"] >= 10 for r in results)
+    
+    def test_warmup_failure_is_reported(self, registry, caplog):
+        """Test that a failed warm-up is logged and reported by readiness."""
+        def fail(progress=None):
+            raise OSError("disk on fire")
+        registry.get("ops").warm_up = fail
+        
+        with caplog.at_level(logging.ERROR):
+            for future in registry.start_warmup():
+                future.exception()
+        
+        readiness = registry.readiness()
+        assert readiness["ready"] is False
+        assert readiness["failed"] is True
+        assert readiness["roots"]["ops"]["error"] == "OSError: disk on fire"
+        assert readiness["roots"]["engineering"]["ready"] is True
+        assert "Warm-up failed for root 'ops'" in caplog.text
+    
+    def test_warmup_does_not_block_search(self, registry):
+        """Test that a slow warm-up leaves the search pool free."""
+        release = threading.Event()
+        for service in registry.services.values():
+            service.warm_up = lambda progress=None: release.wait(5)
+        
+        futures = registry.start_warmup()
+        try:
+            results = registry.search("deploy", limit=10)
+            assert len(results) == 3
+        finally:
+            release.set()
+            for future in futures:
+                future.result()
+    
+    def test_empty_registry(self):
+        """Test that at least one root is required."""
+        with pytest.raises(ValueError):
+            RootRegistry({})
@@ -0,0 +1,90 @@
+"""Tests for single-flight request coalescing."""
+import threading
+import time
+from src.services.singleflight import SingleFlight
+
+
+class TestSingleFlight:
+    """Test SingleFlight."""
+    
+    def run_concurrently(self, flight, key, fn, callers):
+        """Start ``callers`` threads calling ``flight.do`` while ``fn`` is blocked."""
+        results = []
+        errors = []
+        
+        def call():
+            try:
+                results.append(flight.do(key, fn))
+            except Exception as e:
+                errors.append(e)
+        
+        threads = [threading.Thread(target=call) for _ in range(callers)]
+        for thread in threads:
+            thread.start()
+        return threads, results, errors
+    
+    def test_concurrent_calls_share_one_computation(self):
+        """Test that callers for the same key wait on the leader."""
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        invocations = []
+        
+        def compute():
+            invocations.append(1)
+            started.set()
+            release.wait()
+            return "result"
+        
+        threads, results, errors = self.run_concurrently(flight, "key", compute, 5)
+        started.wait()
+        while flight.calls < 5:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+        
+        assert invocations == [1]
+        assert results == ["result"] * 5
+        assert errors == []
+        assert flight.stats() == {"calls": 5, "coalesced": 4, "coalescing_rate": 0.8}
+    
+    def test_errors_are_shared(self):
+        """Test that followers receive the leader's exception."""
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        
+        def compute():
+            started.set()
+            release.wait()
+            raise FileNotFoundError("gone")
+        
+        threads, results, errors = self.run_concurrently(flight, "key", compute, 3)
+        started.wait()
+        while flight.calls < 3:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+        
+        assert results == []
+        assert len(errors) == 3
+        assert all(isinstance(e, FileNotFoundError) for e in errors)
+    
+    def test_sequential_calls_are_not_cached(self):
+        """Test that nothing is reused once a computation has finished."""
+        flight = SingleFlight()
+        values = iter([1, 2])
+        
+        assert flight.do("key", lambda: next(values)) == 1
+        assert flight.do("key", lambda: next(values)) == 2
+        assert flight.stats()["coalesced"] == 0
+    
+    def test_different_keys_do_not_coalesce(self):
+        """Test that distinct keys run independently."""
+        flight = SingleFlight()
+        
+        assert flight.do("a", lambda: "a") == "a"
+        assert flight.do("b", lambda: "b") == "b"
+        assert flight.stats()["coalescing_rate"] == 0.0
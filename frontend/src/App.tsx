@@ -1,8 +1,10 @@
-import React, { useState } from 'react'
-import { BrowserRouter as Router, Routes, Route, useNavigate, useParams } from 'react-router-dom'
+import React, { useEffect, useState } from 'react'
+import { BrowserRouter as Router, Routes, Route, useNavigate, useParams, useSearchParams } from 'react-router-dom'
 import { DirectoryView } from './components/DirectoryView'
 import { ContentView } from './components/ContentView'
 import { SearchView } from './components/SearchView'
+import { apiService } from './services/api'
+import { RootInfo } from './types'
 import './App.css'
 
 function App() {
@@ -11,6 +13,7 @@ function App() {
       <div className="app">
         <header className="app-header">
           <h1>serve-md</h1>
+          <RootSelector />
           <SearchBar />
         </header>
         <main className="app-main">
@@ -26,6 +29,36 @@ function App() {
   )
 }
 
+function RootSelector() {
+  const [roots, setRoots] = useState<RootInfo[]>([])
+  const [searchParams] = useSearchParams()
+  const navigate = useNavigate()
+
+  useEffect(() => {
+    apiService.getRoots().then(setRoots).catch(() => setRoots([]))
+  }, [])
+
+  if (roots.length < 2) {
+    return null
+  }
+
+  const defaultRoot = roots.find((root) => root.default)?.name
+  const current = searchParams.get('root') || defaultRoot
+
+  const handleChange = (e: React.ChangeEvent<HTMLSelectElement>) => {
+    const root = e.target.value
+    navigate(root === defaultRoot ? '/' : `/directory/?root=${encodeURIComponent(root)}`)
+  }
+
+  return (
+    <select value={current} onChange={handleChange} className="root-selector">
+      {roots.map((root) => (
+        <option key={root.name} value={root.name}>{root.name}</option>
+      ))}
+    </select>
+  )
+}
+
 function SearchBar() {
   const [query, setQuery] = useState('')
   const navigate = useNavigate()
@@ -53,14 +86,16 @@ function SearchBar() {
 
 function DirectoryViewRoute() {
   const params = useParams()
+  const [searchParams] = useSearchParams()
   const path = params['*'] || '.'
-  return <DirectoryView path={path} />
+  return <DirectoryView path={path} root={searchParams.get('root') || undefined} />
 }
 
 function ContentViewRoute() {
   const params = useParams()
+  const [searchParams] = useSearchParams()
   const path = params['*'] || 'README.md'
-  return <ContentView path={path} />
+  return <ContentView path={path} root={searchParams.get('root') || undefined} />
 }
 
 export default App
\ No newline at end of file
@@ -1,13 +1,14 @@
 import { useState, useEffect } from 'react'
 import { Link } from 'react-router-dom'
 import { MarkdownContent } from '../types'
-import { apiService } from '../services/api'
+import { apiService, rootQuery } from '../services/api'
 
 interface ContentViewProps {
   path: string
+  root?: string
 }
 
-export function ContentView({ path }: ContentViewProps) {
+export function ContentView({ path, root }: ContentViewProps) {
   const [content, setContent] = useState<MarkdownContent | null>(null)
   const [loading, setLoading] = useState(true)
   const [error, setError] = useState<Error | null>(null)
@@ -17,7 +18,7 @@ export function ContentView({ path }: ContentViewProps) {
       try {
         setLoading(true)
         setError(null)
-        const data = await apiService.getContent(path)
+        const data = await apiService.getContent(path, root)
         setContent(data)
       } catch (err) {
         setError(err as Error)
@@ -28,7 +29,7 @@ export function ContentView({ path }: ContentViewProps) {
     }
 
     fetchContent()
-  }, [path])
+  }, [path, root])
 
   if (loading) {
     return <div className="loading">Loading content...</div>
@@ -47,7 +48,7 @@ export function ContentView({ path }: ContentViewProps) {
       <div className="content-header">
         <h1 className="content-title">{content.title}</h1>
         <div className="content-meta">
-          <Breadcrumb path={path} />
+          <Breadcrumb path={path} root={root} />
           {content.frontmatter.date && (
             <span> • {content.frontmatter.date}</span>
           )}
@@ -65,20 +66,21 @@ export function ContentView({ path }: ContentViewProps) {
   )
 }
 
-function Breadcrumb({ path }: { path: string }) {
+function Breadcrumb({ path, root }: { path: string; root?: string }) {
+  const query = rootQuery(root)
   const parts = path.split('/').filter(Boolean)
   const dirParts = parts.slice(0, -1)
   const fileName = parts[parts.length - 1]
   
   return (
     <div>
-      <Link to="/">Home</Link>
+      <Link to={root ? `/directory/${query}` : '/'}>Home</Link>
       {dirParts.map((part, index) => {
         const currentPath = dirParts.slice(0, index + 1).join('/')
         return (
           <span key={index}>
             {' / '}
-            <Link to={`/directory/${currentPath}`}>{part}</Link>
+            <Link to={`/directory/${currentPath}${query}`}>{part}</Link>
           </span>
         )
       })}
@@ -1,36 +1,73 @@
-import { useState, useEffect } from 'react'
+import { useState, useEffect, useRef } from 'react'
 import { Link } from 'react-router-dom'
-import { DirectoryInfo, FileInfo } from '../types'
-import { apiService } from '../services/api'
+import { DirectoryInfo, DirectoryQuery, FileInfo } from '../types'
+import { apiService, rootQuery } from '../services/api'
+
+const PAGE_SIZE = 200
+const FILTER_DEBOUNCE_MS = 250
 
 interface DirectoryViewProps {
   path: string
+  root?: string
 }
 
-export function DirectoryView({ path }: DirectoryViewProps) {
+export function DirectoryView({ path, root }: DirectoryViewProps) {
   const [directory, setDirectory] = useState<DirectoryInfo | null>(null)
   const [loading, setLoading] = useState(true)
   const [error, setError] = useState<Error | null>(null)
+  const [sort, setSort] = useState<DirectoryQuery['sort']>('name')
+  const [filterInput, setFilterInput] = useState('')
+  const [filter, setFilter] = useState('')
+  const [loadingMore, setLoadingMore] = useState(false)
+  // Aborted whenever the listing query changes, including any pending "load more"
+  const controllerRef = useRef<AbortController | null>(null)
+
+  const query: DirectoryQuery = { sort, order: sort === 'name' ? 'asc' : 'desc', q: filter, limit: PAGE_SIZE }
+
+  useEffect(() => {
+    const timer = setTimeout(() => setFilter(filterInput), FILTER_DEBOUNCE_MS)
+    return () => clearTimeout(timer)
+  }, [filterInput])
 
   useEffect(() => {
+    const controller = new AbortController()
+    controllerRef.current = controller
+
     const fetchDirectory = async () => {
       try {
         setLoading(true)
+        setLoadingMore(false)
         setError(null)
-        const data = await apiService.getDirectory(path)
+        const data = await apiService.getDirectory(path, root, query, controller.signal)
         setDirectory(data)
       } catch (err) {
+        if (controller.signal.aborted) return
         setError(err as Error)
         setDirectory(null)
       } finally {
-        setLoading(false)
+        if (!controller.signal.aborted) setLoading(false)
       }
     }
 
     fetchDirectory()
-  }, [path])
+    return () => controller.abort()
+  }, [path, root, sort, filter])
 
-  if (loading) {
+  const loadMore = async () => {
+    const controller = controllerRef.current
+    if (!directory?.next_cursor || !controller) return
+    try {
+      setLoadingMore(true)
+      const data = await apiService.getDirectory(path, root, { ...query, cursor: directory.next_cursor }, controller.signal)
+      setDirectory((current) => current && { ...data, files: [...current.files, ...data.files] })
+    } catch (err) {
+      if (!controller.signal.aborted) setError(err as Error)
+    } finally {
+      if (!controller.signal.aborted) setLoadingMore(false)
+    }
+  }
+
+  if (loading && !directory) {
     return <div className="loading">Loading directory...</div>
   }
 
@@ -49,31 +86,55 @@ export function DirectoryView({ path }: DirectoryViewProps) {
           {directory.name === '.' ? 'Root Directory' : directory.name}
         </h1>
         <div className="breadcrumb">
-          <Breadcrumb path={path} />
+          <Breadcrumb path={path} root={root} />
+        </div>
+        <div className="directory-controls">
+          <input
+            type="text"
+            value={filterInput}
+            onChange={(e) => setFilterInput(e.target.value)}
+            placeholder="Filter by name..."
+            className="search-input"
+          />
+          <select value={sort} onChange={(e) => setSort(e.target.value as DirectoryQuery['sort'])}>
+            <option value="name">Name</option>
+            <option value="mtime">Last modified</option>
+            <option value="size">Size</option>
+          </select>
+          <span className="directory-count">
+            {directory.files.length} of {directory.total}
+          </span>
         </div>
       </div>
       
       <div className="file-list">
         {directory.files.map((file) => (
-          <FileItem key={file.path} file={file} />
+          <FileItem key={file.path} file={file} root={root} />
         ))}
       </div>
+
+      {directory.next_cursor && (
+        <button onClick={loadMore} disabled={loadingMore} className="search-button load-more">
+          {loadingMore ? 'Loading...' : 'Load more'}
+        </button>
+      )}
     </div>
   )
 }
 
-function Breadcrumb({ path }: { path: string }) {
+function Breadcrumb({ path, root }: { path: string; root?: string }) {
+  const query = rootQuery(root)
   const parts = path === '.' ? [] : path.split('/').filter(Boolean)
   
   return (
     <div>
-      <Link to="/">Home</Link>
+      <Link to={root ? `/directory/${query}` : '/'}>Home</Link>
       {parts.map((part, index) => {
         const currentPath = parts.slice(0, index + 1).join('/')
         return (
           <span key={index}>
             {' / '}
-            <Link to={`/directory/${currentPath}`}>{part}</Link>
+            <Link to={`/directory/${currentPath}${query}`}>{part}</Link>
           </span>
         )
       })}
@@ -81,7 +142,8 @@ function Breadcrumb({ path }: { path: string }) {
   )
 }
 
-function FileItem({ file }: { file: FileInfo }) {
+function FileItem({ file, root }: { file: FileInfo; root?: string }) {
+  const query = rootQuery(root)
   const formatFileSize = (bytes: number) => {
     if (bytes === 0) return '0 B'
     const k = 1024
@@ -96,7 +158,7 @@ function FileItem({ file }: { file: FileInfo }) {
 
   if (file.is_directory) {
     return (
-      <Link to={`/directory/${file.path}`} className="file-item">
+      <Link to={`/directory/${file.path}${query}`} className="file-item">
         <span className="file-icon">📁</span>
         <span className="file-name">{file.name}</span>
         <span className="file-size">{formatDate(file.modified_time)}</span>
@@ -105,7 +167,7 @@ function FileItem({ file }: { file: FileInfo }) {
   }
 
   return (
-    <Link to={`/content/${file.path}`} className="file-item">
+    <Link to={`/content/${file.path}${query}`} className="file-item">
       <span className="file-icon">📄</span>
       <span className="file-name">{file.name}</span>
       <span className="file-size">
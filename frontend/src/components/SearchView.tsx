@@ -1,7 +1,7 @@
 import { useState, useEffect } from 'react'
 import { Link, useSearchParams } from 'react-router-dom'
 import { SearchResult } from '../types'
-import { apiService } from '../services/api'
+import { apiService, rootQuery } from '../services/api'
 
 export function SearchView() {
   const [searchParams] = useSearchParams()
@@ -77,9 +77,9 @@ export function SearchView() {
 
 function SearchResultItem({ result }: { result: SearchResult }) {
   return (
-    <Link to={`/content/${result.path}`} className="search-result">
+    <Link to={`/content/${result.path}${rootQuery(result.root)}`} className="search-result">
       <div className="search-result-title">{result.title}</div>
-      <div className="search-result-path">{result.path}</div>
+      <div className="search-result-path">{result.root}: {result.path}</div>
       <div className="search-result-excerpt">{result.excerpt}</div>
     </Link>
   )
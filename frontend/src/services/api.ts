@@ -1,24 +1,36 @@
-import { DirectoryInfo, MarkdownContent, SearchResult } from '../types'
+import { DirectoryInfo, DirectoryQuery, MarkdownContent, RootInfo, SearchResult } from '../types'
 
 const API_BASE_URL = import.meta.env.PROD ? `${window.location.protocol}//${window.location.hostname}:50858/api` : '/api'
 
 class ApiService {
-  private async fetchJson<T>(url: string): Promise<T> {
-    const response = await fetch(url)
+  private async fetchJson<T>(url: string, signal?: AbortSignal): Promise<T> {
+    const response = await fetch(url, { signal })
     if (!response.ok) {
       throw new Error(`HTTP error! status: ${response.status}`)
     }
     return response.json()
   }
 
-  async getDirectory(path: string = '.'): Promise<DirectoryInfo> {
+  private rootParam(root?: string): string {
+    return root ? `&root=${encodeURIComponent(root)}` : ''
+  }
+
+  async getRoots(): Promise<RootInfo[]> {
+    return this.fetchJson<RootInfo[]>(`${API_BASE_URL}/roots`)
+  }
+
+  async getDirectory(path: string = '.', root?: string, query: DirectoryQuery = {}, signal?: AbortSignal): Promise<DirectoryInfo> {
     const encodedPath = encodeURIComponent(path)
-    return this.fetchJson<DirectoryInfo>(`${API_BASE_URL}/directory?path=${encodedPath}`)
+    const options = Object.entries(query)
+      .filter(([, value]) => value !== undefined && value !== '')
+      .map(([key, value]) => `&${key}=${encodeURIComponent(String(value))}`)
+      .join('')
+    return this.fetchJson<DirectoryInfo>(`${API_BASE_URL}/directory?path=${encodedPath}${this.rootParam(root)}${options}`, signal)
   }
 
-  async getContent(path: string): Promise<MarkdownContent> {
+  async getContent(path: string, root?: string): Promise<MarkdownContent> {
     const encodedPath = encodeURIComponent(path)
-    return this.fetchJson<MarkdownContent>(`${API_BASE_URL}/content?path=${encodedPath}`)
+    return this.fetchJson<MarkdownContent>(`${API_BASE_URL}/content?path=${encodedPath}${this.rootParam(root)}`)
   }
 
   async search(query: string): Promise<SearchResult[]> {
@@ -32,4 +44,8 @@ class ApiService {
   }
 }
 
-export const apiService = new ApiService()
\ No newline at end of file
+export const apiService = new ApiService()
+
+export function rootQuery(root?: string): string {
+  return root ? `?root=${encodeURIComponent(root)}` : ''
+}
\ No newline at end of file
@@ -10,6 +10,16 @@ export interface DirectoryInfo {
   name: string
   path: string
   files: FileInfo[]
+  total: number
+  next_cursor: string | null
+}
+
+export interface DirectoryQuery {
+  sort?: 'name' | 'mtime' | 'size'
+  order?: 'asc' | 'desc'
+  q?: string
+  cursor?: string
+  limit?: number
 }
 
 export interface MarkdownContent {
@@ -18,10 +28,18 @@ export interface MarkdownContent {
   frontmatter: Record<string, any>
   file_path: string
   title: string
+  links: string[]
 }
 
 export interface SearchResult {
+  root: string
   path: string
   title: string
   excerpt: string
+  score: number
+}
+
+export interface RootInfo {
+  name: string
+  default: boolean
 }
\ No newline at end of file